@@ -70,13 +70,18 @@ References:
 """
 
 import numpy as np
+from collections import namedtuple
 from dataclasses import dataclass, field
 from typing import List, Dict, Tuple
+import contextlib
+import functools
+import io
 import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from data.parameters import *
+from models.ss_extension_model import SSExtensionModelV2
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -147,12 +152,33 @@ BILLIONAIRE_TIERS = [
 TOTAL_BILLIONAIRE_WEALTH = sum(t.total_wealth for t in BILLIONAIRE_TIERS)  # ~$8.2T
 TOTAL_BILLIONAIRE_COUNT = sum(t.count for t in BILLIONAIRE_TIERS)  # ~935
 
+# Column-wise (SoA) view of BILLIONAIRE_TIERS for the vectorized revenue code:
+# one contiguous array per field, indexed by tier position.
+_TierArrays = namedtuple('_TierArrays', 'wealth count growth avg_wealth '
+                                        'emigration_elasticity names')
+
+
+def _pack_tiers(tiers) -> _TierArrays:
+    """Pack a list of BillionaireTier records into parallel NumPy arrays."""
+    return _TierArrays(
+        wealth=np.fromiter((t.total_wealth for t in tiers), dtype=np.float64),
+        count=np.fromiter((t.count for t in tiers), dtype=np.float64),
+        growth=np.fromiter((t.wealth_growth_rate for t in tiers), dtype=np.float64),
+        avg_wealth=np.fromiter((t.avg_wealth for t in tiers), dtype=np.float64),
+        emigration_elasticity=np.fromiter((t.emigration_elasticity for t in tiers),
+                                          dtype=np.float64),
+        names=[t.name for t in tiers],
+    )
+
+
+TIER_ARR = _pack_tiers(BILLIONAIRE_TIERS)
+
 
 # ═══════════════════════════════════════════════════════════════════════
 #  BEHAVIORAL RESPONSE MODEL
 # ═══════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BehavioralResponse:
     """
     Models how billionaires respond to taxation.
@@ -190,14 +216,27 @@ class BehavioralResponse:
 
         Returns dict with effective rate and revenue reduction factors.
         """
+        response = self.compute_effective_rates(statutory_rate, tier.emigration_elasticity)
+        response = {k: float(v) for k, v in response.items()}
+        response['statutory_rate'] = statutory_rate
+        return response
+
+    def compute_effective_rates(self, statutory_rate, emigration_elasticity) -> dict:
+        """
+        Vectorized form of compute_effective_rate().
+
+        statutory_rate and emigration_elasticity may be scalars or arrays
+        (one entry per tier); every value in the returned dict broadcasts
+        to their common shape.
+        """
         # Avoidance
-        avoidance = min(
+        avoidance = np.minimum(
             self.avoidance_base_rate + self.avoidance_elasticity * statutory_rate,
             self.avoidance_ceiling
         )
 
         # Evasion
-        evasion = min(
+        evasion = np.minimum(
             self.evasion_base_rate + self.evasion_elasticity * statutory_rate,
             0.15  # Cap at 15%
         )
@@ -207,13 +246,13 @@ class BehavioralResponse:
         # Unrealized gains ≈ 56% of wealth (ATF 2025)
         unrealized_share = 0.56
         exit_tax_cost = self.exit_tax_rate * unrealized_share  # ~13.3% of wealth to leave
-        net_emigration_benefit = max(statutory_rate - exit_tax_cost, 0)
+        net_emigration_benefit = np.maximum(statutory_rate - exit_tax_cost, 0)
 
         # Annual emigration probability: elasticity × net benefit × tier mobility
-        emigration_prob = (tier.emigration_elasticity *
+        emigration_prob = (emigration_elasticity *
                           net_emigration_benefit * 10 *  # Scale factor
                           (1 / self.emigration_cost_multiplier))
-        emigration_prob = min(emigration_prob, 0.05)  # Cap at 5%/year
+        emigration_prob = np.minimum(emigration_prob, 0.05)  # Cap at 5%/year
 
         # Combined revenue retention
         retention = (1 - avoidance) * (1 - evasion)
@@ -236,9 +275,9 @@ class BehavioralResponse:
 #  THE OPTIMIZER
 # ═══════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WealthTaxConfig:
-    """Configuration for a wealth tax scenario."""
+    """Configuration for a wealth tax scenario (immutable and hashable)."""
     name: str
     description: str
 
@@ -256,6 +295,18 @@ class WealthTaxConfig:
     pct_to_tier2: float = 0.0           # % that goes directly to Tier 2
 
 
+@functools.lru_cache(maxsize=32)
+def _cfg(rate: float) -> WealthTaxConfig:
+    """Graduated `rate` (half rate below $1B) with a 60/40 fund/Tier 2 split."""
+    return WealthTaxConfig(
+        name=f'{rate:.0%}', description='',
+        income_tax_rate_above_1b=rate,
+        income_tax_rate_0_to_1b=rate * 0.5,
+        pct_to_equity_fund=0.60,
+        pct_to_tier2=0.40,
+    )
+
+
 class WealthTaxOptimizer:
     """
     Optimizer that finds the tax rate needed to fully fund the equity trust fund.
@@ -270,6 +321,7 @@ class WealthTaxOptimizer:
     def __init__(self, behavioral: BehavioralResponse = None):
         self.behavioral = behavioral or BehavioralResponse()
         self.tiers = BILLIONAIRE_TIERS
+        self.tier_arr = TIER_ARR
 
     def compute_annual_revenue(self, config: WealthTaxConfig, year: int = 0) -> dict:
         """
@@ -279,76 +331,87 @@ class WealthTaxOptimizer:
         ≈ wealth_growth_rate × wealth (mark-to-market basis)
 
         This follows the Wyden/Saez-Zucman framework.
+
+        Results for the standard tier table are memoized on
+        (behavioral, config, year), so the returned dict is shared between
+        callers and must be treated as read-only.
         """
-        total_gross_revenue = 0
-        total_net_revenue = 0
-        tier_details = []
-
-        for tier in self.tiers:
-            # Wealth at this year (grows, minus emigration erosion from prior years)
-            wealth = tier.total_wealth * ((1 + tier.wealth_growth_rate) ** year)
-
-            # Economic income = wealth × growth rate (mark-to-market)
-            economic_income = wealth * tier.wealth_growth_rate
-
-            # Apply graduated rates
-            # Income up to $1B/yr per individual
-            per_person_income = economic_income / tier.count
-            income_below_1b = min(per_person_income, 1e9) * tier.count
-            income_above_1b = max(per_person_income - 1e9, 0) * tier.count
-
-            gross_tax = (income_below_1b * config.income_tax_rate_0_to_1b +
-                        income_above_1b * config.income_tax_rate_above_1b)
-
-            # Add annual wealth tax if applicable
-            if config.annual_wealth_tax_rate > 0:
-                gross_tax += wealth * config.annual_wealth_tax_rate
-
-            # Behavioral response
-            # Use the blended statutory rate for response calculation
-            blended_statutory = gross_tax / max(economic_income, 1)
-            response = self.behavioral.compute_effective_rate(blended_statutory, tier)
-
-            net_tax = gross_tax * response['retention_rate']
-
-            # Emigration reduces the tax base over time (cumulative)
-            cumulative_emigration = 1 - (1 - response['emigration_prob_annual']) ** max(year, 1)
-            remaining_base = 1 - cumulative_emigration
-            net_tax *= remaining_base
-
-            # But emigrating billionaires pay the EXIT TAX (one-time revenue)
-            # IRC 877A: 23.8% on all unrealized gains
-            if year > 0:
-                # Number who emigrated this year
-                newly_emigrated = tier.count * response['emigration_prob_annual'] * remaining_base
-                exit_tax_revenue = newly_emigrated * tier.avg_wealth * 0.56 * 0.238
-            else:
-                exit_tax_revenue = 0
-
-            total_gross_revenue += gross_tax
-            total_net_revenue += net_tax + exit_tax_revenue
-
-            tier_details.append({
-                'tier': tier.name,
-                'wealth': wealth,
-                'economic_income': economic_income,
-                'per_person_income': per_person_income,
-                'gross_tax': gross_tax,
-                'net_tax': net_tax,
-                'exit_tax_revenue': exit_tax_revenue,
-                'effective_rate': response['effective_rate'],
-                'avoidance': response['avoidance_rate'],
-                'emigration_annual': response['emigration_prob_annual'],
-                'cumulative_emigration': cumulative_emigration,
-            })
+        if self.tier_arr is TIER_ARR:
+            return _cached_annual_revenue(self.behavioral, config, year)
+        return self._compute_annual_revenue(config, year)
+
+    def _compute_annual_revenue(self, config: WealthTaxConfig, year: int) -> dict:
+        """Uncached body of compute_annual_revenue()."""
+        arr = self.tier_arr
+
+        # Wealth at this year (grows, minus emigration erosion from prior years)
+        wealth_by_tier = arr.wealth * ((1 + arr.growth) ** year)
+
+        # Economic income = wealth × growth rate (mark-to-market)
+        income_by_tier = wealth_by_tier * arr.growth
+        per_person_by_tier = income_by_tier / arr.count
+
+        # Graduated rates applied to every tier in one vectorized pass
+        gross_by_tier = _gross_tax(income_by_tier, arr.count,
+                                   config.income_tax_rate_0_to_1b,
+                                   config.income_tax_rate_above_1b)
+
+        # Add annual wealth tax if applicable
+        if config.annual_wealth_tax_rate > 0:
+            gross_by_tier = gross_by_tier + wealth_by_tier * config.annual_wealth_tax_rate
+
+        total_gross_revenue = gross_by_tier.sum()
+
+        # Behavioral response for all tiers at once
+        # Use the blended statutory rate for response calculation
+        blended_statutory = gross_by_tier / np.maximum(income_by_tier, 1)
+        response = self.behavioral.compute_effective_rates(
+            blended_statutory, arr.emigration_elasticity)
+        emigration_annual = response['emigration_prob_annual']
+
+        net_by_tier = gross_by_tier * response['retention_rate']
+
+        # Emigration reduces the tax base over time (cumulative)
+        cumulative_emigration = 1 - (1 - emigration_annual) ** max(year, 1)
+        remaining_base = 1 - cumulative_emigration
+        net_by_tier = net_by_tier * remaining_base
+
+        # But emigrating billionaires pay the EXIT TAX (one-time revenue)
+        # IRC 877A: 23.8% on all unrealized gains
+        if year > 0:
+            # Number who emigrated this year
+            newly_emigrated = arr.count * emigration_annual * remaining_base
+            exit_by_tier = newly_emigrated * arr.avg_wealth * 0.56 * 0.238
+        else:
+            exit_by_tier = np.zeros_like(net_by_tier)
+
+        total_net_revenue = (net_by_tier + exit_by_tier).sum()
+
+        tier_details = [
+            {
+                'tier': arr.names[i],
+                'wealth': wealth_by_tier[i],
+                'economic_income': income_by_tier[i],
+                'per_person_income': per_person_by_tier[i],
+                'gross_tax': gross_by_tier[i],
+                'net_tax': net_by_tier[i],
+                'exit_tax_revenue': exit_by_tier[i],
+                'effective_rate': response['effective_rate'][i],
+                'avoidance': response['avoidance_rate'][i],
+                'emigration_annual': emigration_annual[i],
+                'cumulative_emigration': cumulative_emigration[i],
+            }
+            for i in range(len(arr.names))
+        ]
 
         return {
             'total_gross_revenue': total_gross_revenue,
             'total_net_revenue': total_net_revenue,
             'effective_rate_overall': total_net_revenue / max(total_gross_revenue, 1) * (
-                total_gross_revenue / max(sum(t.total_wealth * t.wealth_growth_rate
-                                              for t in self.tiers), 1)),
+                total_gross_revenue / max((arr.wealth * arr.growth).sum(), 1)),
             'tier_details': tier_details,
+            'avoidance_per_tier': response['avoidance_rate'],
+            'evasion_per_tier': response['evasion_rate'],
             'to_equity_fund': total_net_revenue * config.pct_to_equity_fund,
             'to_tier2': total_net_revenue * config.pct_to_tier2,
         }
@@ -499,9 +562,9 @@ class WealthTaxOptimizer:
             proj = self.project_with_wealth_tax(config, years=40)
 
             # Find when fund hits $5T, $8T, $10T
-            hit_5t = np.where(proj['wt_fund'] >= 5e12)[0]
-            hit_8t = np.where(proj['wt_fund'] >= 8e12)[0]
-            hit_10t = np.where(proj['wt_fund'] >= 10e12)[0]
+            hit_5t = _first_ge(proj['wt_fund'], 5e12)
+            hit_8t = _first_ge(proj['wt_fund'], 8e12)
+            hit_10t = _first_ge(proj['wt_fund'], 10e12)
 
             # Tier 2 boost from wealth tax (25% of net revenue / adults / 12)
             tier2_boost_yr0 = (yr0['to_tier2'] / 258e6) / 12
@@ -519,15 +582,71 @@ class WealthTaxOptimizer:
                 'fund_yr10': proj['wt_fund'][10],
                 'fund_yr20': proj['wt_fund'][20],
                 'fund_yr30': proj['wt_fund'][30],
-                'hit_5t': hit_5t[0] if len(hit_5t) > 0 else 999,
-                'hit_8t': hit_8t[0] if len(hit_8t) > 0 else 999,
-                'hit_10t': hit_10t[0] if len(hit_10t) > 0 else 999,
+                'hit_5t': hit_5t if hit_5t >= 0 else 999,
+                'hit_8t': hit_8t if hit_8t >= 0 else 999,
+                'hit_10t': hit_10t if hit_10t >= 0 else 999,
                 'baseline_no_wt_yr20': self._baseline_fund_at_year(20, 500e9, 200e9, 0.04),
             })
 
         return sweep_results
 
 
+@functools.lru_cache(maxsize=4096)
+def _cached_annual_revenue(behavioral: BehavioralResponse, config: WealthTaxConfig,
+                           year: int) -> dict:
+    """Memoized compute_annual_revenue() for the standard BILLIONAIRE_TIERS."""
+    return WealthTaxOptimizer(behavioral)._compute_annual_revenue(config, year)
+
+
+def _gross_tax(economic_income, count, rate_0_to_1b, rate_above_1b):
+    """
+    Graduated tax on mark-to-market economic income, vectorized over tiers.
+
+    Each individual pays rate_0_to_1b on their first $1B of income and
+    rate_above_1b on the rest. Broadcasts over any leading axes (e.g. years),
+    with the tier axis last.
+    """
+    per_person_income = economic_income / count
+    income_below_1b = np.minimum(per_person_income, 1e9) * count
+    income_above_1b = np.maximum(per_person_income - 1e9, 0) * count
+    return income_below_1b * rate_0_to_1b + income_above_1b * rate_above_1b
+
+
+def _project_wealth(wealth, growth, rates, years: int):
+    """
+    Total billionaire wealth when each tier's growth is taxed at `rate`.
+
+    wealth and growth are per-tier arrays. Returns an array of shape
+    (len(rates), years + 1) for Years 0..years, with the tier axis summed out.
+    """
+    # Post-tax growth factor per (rate, tier); compounding over integer years
+    # is a running product, one multiply per year instead of a pow
+    post_tax_growth = growth[None, :] * (1 - rates)[:, None]
+    factors = np.empty(post_tax_growth.shape + (years + 1,))
+    factors[..., 0] = 1.0
+    factors[..., 1:] = (1 + post_tax_growth)[..., None]
+    np.cumprod(factors, axis=-1, out=factors)
+    return (wealth[None, :, None] * factors).sum(axis=1)
+
+
+def _first_ge(arr: np.ndarray, threshold: float) -> int:
+    """Index of the first element >= threshold, or -1 if it is never reached."""
+    mask = arr >= threshold
+    i = int(mask.argmax())
+    return i if mask[i] else -1
+
+
+def _enforcement_factor(years: int) -> np.ndarray:
+    """
+    Enforcement strength by year for the realistic central projection.
+
+    Enforcement starts strong, degrades 1%/year after Year 5, and bottoms
+    out at 70% of peak capacity.
+    """
+    t = np.arange(years)
+    return np.clip(1.0 - 0.01 * np.maximum(t - 5, 0), 0.70, 1.0)
+
+
 def _find_crossover(series_a, series_b, length):
     """Find where series_a first exceeds series_b by 2x."""
     for t in range(length):
@@ -556,8 +675,6 @@ def project_ss_extension_with_wealth_tax(
     Returns the same structure as SSExtensionModelV2.project() but with
     wealth tax integrated.
     """
-    from models.ss_extension_model import SSExtensionModelV2, SSRevenueReform
-
     optimizer = WealthTaxOptimizer()
     behavioral = BehavioralResponse()
 
@@ -656,6 +773,11 @@ def project_ss_extension_with_wealth_tax(
 #  OUTPUT & ANALYSIS
 # ═══════════════════════════════════════════════════════════════════════
 
+# Milestone years sampled by the report tables
+_MILESTONES_FULL = np.array([0, 5, 10, 20, 30, 39])
+_MILESTONES_SHORT = np.array([0, 10, 20, 30, 39])
+
+
 def run_wealth_tax_analysis():
     """Complete wealth tax optimization analysis."""
 
@@ -678,7 +800,7 @@ def run_wealth_tax_analysis():
     print(f"  {'TOTAL':<30} {TOTAL_BILLIONAIRE_COUNT:>8,} ${TOTAL_BILLIONAIRE_WEALTH/1e9:>10,.0f}B "
           f"${TOTAL_BILLIONAIRE_WEALTH/TOTAL_BILLIONAIRE_COUNT/1e9:>10.1f}B")
 
-    total_economic_income = sum(t.total_wealth * t.wealth_growth_rate for t in BILLIONAIRE_TIERS)
+    total_economic_income = (TIER_ARR.wealth * TIER_ARR.growth).sum()
     print(f"\n  Total annual economic income (mark-to-market): ${total_economic_income/1e9:,.0f}B")
     print(f"  Current effective tax on this income: ~3.4% (ProPublica)")
     print(f"  Current tax collected: ~${total_economic_income * 0.034/1e9:,.0f}B")
@@ -755,6 +877,9 @@ def run_wealth_tax_analysis():
         (1.00, '100% on income >$1B (maximum extraction)'),
     ]
 
+    row_fmt = ("    {t:<8} ${total:>8.0f} ${tier2:>8.0f} ${tier3:>8.0f} "
+               "${fund:>8.1f} ${rev:>8.0f}").format
+
     all_scenarios = {}
     for rate, label in tax_scenarios:
         if rate > 0:
@@ -766,7 +891,6 @@ def run_wealth_tax_analysis():
             )
         else:
             # Baseline
-            from models.ss_extension_model import SSExtensionModelV2
             base_model = SSExtensionModelV2(scenario='moderate')
             base = base_model.project(years=40)
             proj = {
@@ -783,13 +907,14 @@ def run_wealth_tax_analysis():
         print(f"\n  {label}")
         print(f"    {'Year':<8} {'Total$/mo':>10} {'Tier2':>10} {'Tier3':>10} {'Fund($T)':>10} {'WTRev($B)':>10}")
         print("    " + "─" * 58)
-        for t in [0, 5, 10, 20, 30, 39]:
-            fund_val = proj['enhanced_fund'][t] / 1e12 if t < len(proj['enhanced_fund']) else 0
-            print(f"    {t:<8} ${proj['enhanced_total'][t]:>8.0f} "
-                  f"${proj['enhanced_tier2'][t]:>8.0f} "
-                  f"${proj['enhanced_tier3'][t]:>8.0f} "
-                  f"${fund_val:>8.1f} "
-                  f"${proj['wt_net_revenue'][t]/1e9:>8.0f}")
+        total_t = proj['enhanced_total'].take(_MILESTONES_FULL)
+        tier2_t = proj['enhanced_tier2'].take(_MILESTONES_FULL)
+        tier3_t = proj['enhanced_tier3'].take(_MILESTONES_FULL)
+        fund_t = proj['enhanced_fund'].take(_MILESTONES_FULL) / 1e12
+        rev_t = proj['wt_net_revenue'].take(_MILESTONES_FULL) / 1e9
+        for i, t in enumerate(_MILESTONES_FULL):
+            print(row_fmt(t=t, total=total_t[i], tier2=tier2_t[i], tier3=tier3_t[i],
+                          fund=fund_t[i], rev=rev_t[i]))
 
     # === BOTTOM LINE — THE OPTIMAL ZONE ===
     print(f"\n\n{'=' * 100}")
@@ -800,25 +925,26 @@ def run_wealth_tax_analysis():
     print(f"\n  Adult Monthly Benefit Comparison:")
     print(f"  {'Rate':<30} {'Year 0':>10} {'Year 10':>10} {'Year 20':>10} {'Year 30':>10} {'Year 39':>10}")
     print("  " + "─" * 80)
-    for rate, label in tax_scenarios:
-        p = all_scenarios[rate]
-        short_label = label.split('(')[0].strip()
-        print(f"  {short_label:<30} ${p['enhanced_total'][0]:>8.0f} "
-              f"${p['enhanced_total'][10]:>8.0f} "
-              f"${p['enhanced_total'][20]:>8.0f} "
-              f"${p['enhanced_total'][30]:>8.0f} "
-              f"${p['enhanced_total'][39]:>8.0f}")
+    # Stack every scenario once (scenario × year) and slice the milestone
+    # columns for both tables in a single indexing step
+    short_labels = [label.split('(')[0].strip() for _, label in tax_scenarios]
+    totals = np.stack([all_scenarios[rate]['enhanced_total'] for rate, _ in tax_scenarios])
+    funds = np.stack([all_scenarios[rate]['enhanced_fund'] for rate, _ in tax_scenarios])
+    benefit_rows = totals.take(_MILESTONES_SHORT, axis=1)
+    fund_rows = funds[:, [10, 20, 30]] / 1e12
+
+    benefit_fmt = ("  {:<30} ${:>8.0f} ${:>8.0f} ${:>8.0f} "
+                   "${:>8.0f} ${:>8.0f}").format
+    for short_label, row in zip(short_labels, benefit_rows):
+        print(benefit_fmt(short_label, *row))
 
     # Equity Fund Comparison
     print(f"\n  Equity Fund Balance:")
     print(f"  {'Rate':<30} {'Year 10':>10} {'Year 20':>10} {'Year 30':>10}")
     print("  " + "─" * 60)
-    for rate, label in tax_scenarios:
-        p = all_scenarios[rate]
-        short_label = label.split('(')[0].strip()
-        print(f"  {short_label:<30} ${p['enhanced_fund'][10]/1e12:>8.1f}T "
-              f"${p['enhanced_fund'][20]/1e12:>8.1f}T "
-              f"${p['enhanced_fund'][30]/1e12:>8.1f}T")
+    fund_fmt = "  {:<30} ${:>8.1f}T ${:>8.1f}T ${:>8.1f}T".format
+    for short_label, row in zip(short_labels, fund_rows):
+        print(fund_fmt(short_label, *row))
 
     # Behavioral warning
     print(f"""
@@ -1067,6 +1193,94 @@ BEHAVIORAL_REGIMES = {
     },
 }
 
+# Display order for the four reference regimes in the report tables,
+# resolved once as (key, regime) pairs
+_REGIME_ORDER = tuple(
+    (k, BEHAVIORAL_REGIMES[k])
+    for k in ('pessimistic', 'original', 'severely_reduced', 'near_zero')
+)
+
+
+def _project_regime(regime, config):
+    """
+    Project the equity fund with wealth tax under one behavioral regime.
+
+    Returns the 40-year projection dict from project_with_wealth_tax().
+    """
+    opt = WealthTaxOptimizer(behavioral=regime['params'])
+    return opt.project_with_wealth_tax(
+        config, years=40,
+        base_fund_seed=500e9,
+        base_annual_contribution=200e9,
+        fund_return=0.04,
+    )
+
+
+# Static verdict box for Section 5 of the critical analysis (no interpolation)
+_CRITICAL_VERDICT = """
+  ┌─────────────────────────────────────────────────────────────────────────────────────────────────┐
+  │  WHAT IS DEFENSIBLE                                                                            │
+  ├─────────────────────────────────────────────────────────────────────────────────────────────────┤
+  │                                                                                                │
+  │  1. Mark-to-market taxation STRUCTURALLY eliminates the 4 largest avoidance channels           │
+  │     for publicly traded assets. This is not speculative — it's mechanical.                     │
+  │     Evidence: Senate Finance Committee analysis, CBPP, Equitable Growth.                       │
+  │                                                                                                │
+  │  2. The exit tax (IRC 877A) makes emigration EXPENSIVE, not free.                              │
+  │     A $100B billionaire pays ~$13.3B to leave. Only 4,820 people renounced                     │
+  │     citizenship in 2024 — and most were NOT billionaires.                                      │
+  │                                                                                                │
+  │  3. At 40% rate, EVEN the pessimistic regime generates meaningful revenue.                     │
+  │     Worst case (50% avoidance + 15% evasion): still ~$120B/year net.                           │
+  │     That's $120B that doesn't exist today. It accelerates the fund.                            │
+  │                                                                                                │
+  │  4. The "severely reduced" avoidance regime (15% ceiling) IS achievable IF:                    │
+  │     - IRS enforcement is fully funded (not guaranteed post-2025 cuts)                          │
+  │     - Private company valuations are effectively policed                                       │
+  │     - Anti-abuse rules prevent reclassification from public to private                         │
+  │     These are design choices, not laws of nature.                                              │
+  │                                                                                                │
+  ├─────────────────────────────────────────────────────────────────────────────────────────────────┤
+  │  WHAT IS NOT DEFENSIBLE                                                                        │
+  ├─────────────────────────────────────────────────────────────────────────────────────────────────┤
+  │                                                                                                │
+  │  1. Assuming near-zero avoidance. Only ~20% of billionaire wealth is in                        │
+  │     publicly traded assets directly reachable by annual mark-to-market.                        │
+  │     ~50%+ is in private businesses with genuine valuation challenges.                          │
+  │     Pretending this problem doesn't exist produces fantasy revenue numbers.                    │
+  │                                                                                                │
+  │  2. Assuming avoidance is static. Billionaires will spend $1 to avoid                          │
+  │     $1.01 in taxes. The avoidance industry will innovate. The first few                        │
+  │     years may show high collection; later years will show adaptation.                          │
+  │                                                                                                │
+  │  3. Assuming IRS enforcement is permanent. The IRS has already lost 25%+                       │
+  │     of its workforce in 2025. Political cycles can gut enforcement.                            │
+  │                                                                                                │
+  │  4. Assuming the Supreme Court won't intervene. 4 of 9 justices signaled                      │
+  │     that taxing unrealized gains may require a constitutional amendment.                       │
+  │     Moore v. US (2024) left this door open.                                                    │
+  │                                                                                                │
+  ├─────────────────────────────────────────────────────────────────────────────────────────────────┤
+  │  THE HONEST CENTRAL ESTIMATE                                                                   │
+  ├─────────────────────────────────────────────────────────────────────────────────────────────────┤
+  │                                                                                                │
+  │  The defensible range for avoidance at 40% rate is 15-50%.                                     │
+  │  Central estimate: ~25-30% avoidance, ~5% evasion → ~67-70% collection rate.                   │
+  │                                                                                                │
+  │  This is BETWEEN the "original" and "severely reduced" regimes.                                │
+  │  The original model's 55% collection at 40% rate was too pessimistic.                          │
+  │  The severely-reduced model's 85% collection is achievable but requires                        │
+  │  sustained political will for IRS enforcement.                                                 │
+  │                                                                                                │
+  │  RECOMMENDED PLANNING ASSUMPTION: Use "original" regime as the FLOOR                           │
+  │  (what happens with weak enforcement) and "severely_reduced" as the                            │
+  │  CEILING (what's achievable with strong enforcement). Plan for the                             │
+  │  floor, aim for the ceiling.                                                                   │
+  │                                                                                                │
+  └─────────────────────────────────────────────────────────────────────────────────────────────────┘
+
+"""
+
 
 def run_critical_behavioral_analysis():
     """
@@ -1075,7 +1289,20 @@ def run_critical_behavioral_analysis():
     This is the intellectually honest section: we show that the SAME
     tax rate produces wildly different revenue depending on assumptions
     about avoidance/evasion. The user must understand this uncertainty.
+
+    The report is rendered into a buffer and written to stdout in one call
+    rather than line by line.
     """
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            _print_critical_behavioral_analysis()
+    finally:
+        sys.stdout.write(buf.getvalue())
+
+
+def _print_critical_behavioral_analysis():
+    """Body of run_critical_behavioral_analysis(); prints the full report."""
 
     print("\n" + "=" * 105)
     print("  CRITICAL ANALYSIS: BEHAVIORAL RESPONSE REGIMES")
@@ -1115,18 +1342,19 @@ def run_critical_behavioral_analysis():
     print(f"{'━' * 105}")
 
     test_rate = 0.40
-    config_40 = WealthTaxConfig(
-        name='40% billionaire income tax',
-        description='40% on economic income for >$1B wealth',
-        income_tax_rate_above_1b=test_rate,
-        income_tax_rate_0_to_1b=test_rate * 0.5,
-        pct_to_equity_fund=0.60,
-        pct_to_tier2=0.40,
+    config_40 = _cfg(test_rate)
+
+    # Gross revenue depends only on the tax config, not on the behavioral
+    # regime, so compute it once and share it with every regime row below
+    zero_behavior = BehavioralResponse(
+        avoidance_base_rate=0, avoidance_elasticity=0, avoidance_ceiling=0,
+        evasion_base_rate=0, evasion_elasticity=0,
     )
+    gross_40 = WealthTaxOptimizer(zero_behavior).compute_annual_revenue(
+        config_40, year=0)['total_gross_revenue']
 
     print(f"\n  40% statutory rate on mark-to-market economic income")
-    print(f"  Gross revenue (before behavioral response): "
-          f"${WealthTaxOptimizer(BehavioralResponse(avoidance_base_rate=0, avoidance_elasticity=0, avoidance_ceiling=0, evasion_base_rate=0, evasion_elasticity=0)).compute_annual_revenue(config_40, year=0)['total_gross_revenue']/1e9:,.0f}B\n")
+    print(f"  Gross revenue (before behavioral response): ${gross_40/1e9:,.0f}B\n")
 
     print(f"  {'Regime':<35} {'Avoid%':>8} {'Evade%':>8} {'Retain%':>8} {'Net Rev':>10} {'Collect%':>10}")
     print("  " + "─" * 79)
@@ -1137,16 +1365,15 @@ def run_critical_behavioral_analysis():
         rev = opt.compute_annual_revenue(config_40, year=0)
 
         # Get the average avoidance/evasion across tiers
-        avg_avoid = np.mean([d['avoidance'] for d in rev['tier_details']])
-        avg_evade = np.mean([d.get('evasion_rate', 0) for d in rev['tier_details']
-                            if 'evasion_rate' in d])
+        avg_avoid = rev['avoidance_per_tier'].mean()
+        avg_evade = rev['evasion_per_tier'].mean()
         # Compute evasion from the behavioral model
         resp = regime['params'].compute_effective_rate(test_rate, BILLIONAIRE_TIERS[0])
         avoid = resp['avoidance_rate']
         evade = resp['evasion_rate']
         retain = resp['retention_rate']
 
-        gross = rev['total_gross_revenue']
+        gross = gross_40
         net = rev['total_net_revenue']
         collect_pct = net / gross if gross > 0 else 0
 
@@ -1205,26 +1432,17 @@ def run_critical_behavioral_analysis():
     print("  SECTION C: 40-YEAR BENEFIT TRAJECTORIES — 40% RATE ACROSS ALL REGIMES")
     print(f"{'━' * 105}")
 
-    regime_projections = {}
-    for regime_key, regime in BEHAVIORAL_REGIMES.items():
-        # We need to run the full integrated projection with each behavioral regime
-        opt = WealthTaxOptimizer(behavioral=regime['params'])
-
-        # Project equity fund with wealth tax under this regime
-        proj_data = opt.project_with_wealth_tax(
-            config_40, years=40,
-            base_fund_seed=500e9,
-            base_annual_contribution=200e9,
-            fund_return=0.04,
-        )
-        regime_projections[regime_key] = proj_data
+    # Run serially: the five projections take ~20 ms in total, less than
+    # the cost of starting a process pool, and stay in this process's caches
+    regime_projections = {k: _project_regime(r, config_40)
+                          for k, r in BEHAVIORAL_REGIMES.items()}
 
     print(f"\n  Equity Fund at Year 30 (40% rate, split 75/25 fund/Tier2):")
     print(f"  {'Regime':<35} {'Fund@Y10':>10} {'Fund@Y20':>10} {'Fund@Y30':>10} {'Fund@Y39':>10}")
     print("  " + "─" * 75)
-    for regime_key in ['pessimistic', 'original', 'severely_reduced', 'near_zero']:
+    for regime_key, regime in _REGIME_ORDER:
         p = regime_projections[regime_key]
-        print(f"  {BEHAVIORAL_REGIMES[regime_key]['name']:<35} "
+        print(f"  {regime['name']:<35} "
               f"${p['wt_fund'][10]/1e12:>8.1f}T "
               f"${p['wt_fund'][20]/1e12:>8.1f}T "
               f"${p['wt_fund'][30]/1e12:>8.1f}T "
@@ -1235,22 +1453,24 @@ def run_critical_behavioral_analysis():
     print(f"  {'Regime':<35} {'Year 0':>10} {'Year 10':>10} {'Year 20':>10} {'Year 30':>10}")
     print("  " + "─" * 75)
 
-    for regime_key in ['pessimistic', 'original', 'severely_reduced', 'near_zero']:
-        regime = BEHAVIORAL_REGIMES[regime_key]
+    # The base projection is independent of regime and rate; it is shared
+    # by this table and the Section D sweep below
+    base = SSExtensionModelV2(scenario='moderate').project(years=40)
+    adults = base['adults']
+    base_monthly = base['total_monthly_adult']
+    # Monthly Tier 2 dollars per adult for each $1 of net revenue (40% share)
+    tier2_per_dollar = 0.40 / (12.0 * adults)
+
+    for regime_key, regime in _REGIME_ORDER:
         opt = WealthTaxOptimizer(behavioral=regime['params'])
 
         # Compute year-by-year revenue and add to base model
-        from models.ss_extension_model import SSExtensionModelV2
-        base_model = SSExtensionModelV2(scenario='moderate')
-        base = base_model.project(years=40)
+        revs = np.fromiter((opt.compute_annual_revenue(config_40, year=t)['total_net_revenue']
+                            for t in range(40)), dtype=np.float64, count=40)
+        # 40% of net revenue goes to Tier 2 directly
+        wt_boost = revs * tier2_per_dollar
 
-        wt_boost = np.zeros(40)
-        for t in range(40):
-            rev = opt.compute_annual_revenue(config_40, year=t)
-            # 40% of net revenue goes to Tier 2 directly
-            wt_boost[t] = (rev['total_net_revenue'] * 0.40 / base['adults'][t]) / 12
-
-        total_benefit = base['total_monthly_adult'] + wt_boost
+        total_benefit = base_monthly + wt_boost
 
         print(f"  {regime['name']:<35} "
               f"${total_benefit[0]:>8.0f} "
@@ -1263,111 +1483,153 @@ def run_critical_behavioral_analysis():
     print("  CRITICAL VERDICT: WHAT CAN WE HONESTLY CLAIM?")
     print(f"{'=' * 105}")
 
-    print(f"""
+    sys.stdout.write(_CRITICAL_VERDICT)
+
+    # === SECTION 6: SENSITIVITY — WHICH RATE + REGIME COMBOS HIT $500/mo BY YEAR 20? ===
+    print(f"{'━' * 105}")
+    print("  SECTION D: WHEN DOES TOTAL BENEFIT HIT $500/MONTH?")
+    print(f"{'━' * 105}")
+
+    print(f"\n  (SS Extension V2.0 + Billionaire Tax, 60/40 fund/Tier2 split)")
+    print(f"  {'Rate':<10}" + "".join(f"  {regime['name'][:18]:>20}"
+                                      for _, regime in _REGIME_ORDER))
+    print("  " + "─" * 90)
+
+    # Revenue is not linear in the rate (behavioral response), so build the
+    # full (rate, regime, year) tensor and search all milestones at once.
+    sweep_rates = [0.20, 0.30, 0.40, 0.50, 0.60, 0.80, 1.00]
+    optimizers = [WealthTaxOptimizer(behavioral=regime['params'])
+                  for _, regime in _REGIME_ORDER]
+    revs = np.array([
+        [[opt.compute_annual_revenue(cfg, year=t)['total_net_revenue'] for t in range(40)]
+         for opt in optimizers]
+        for cfg in map(_cfg, sweep_rates)
+    ])
+    total = base_monthly + revs * tier2_per_dollar
+    reached = total >= 500
+    hit_year = np.where(reached.any(axis=-1), reached.argmax(axis=-1), -1)
+
+    rows = []
+    for rate, hits in zip(sweep_rates, hit_year.tolist()):
+        cols = [f"  {rate:>5.0%}    "]
+        for hit in hits:
+            label = 'Year ' + str(hit) if hit >= 0 else '>40 years'
+            cols.append(f"  {label:>20}")
+        rows.append("".join(cols))
+    print("\n".join(rows))
+
+    print(f"\n  Without any wealth tax: $500/month reached at Year 34-35 (moderate scenario)")
+
+
+# Static Test 4 critique: the four factors near-zero avoidance ignores
+_NEAR_ZERO_CRITIQUE = """
+  The near-zero avoidance assumption (1-5% ceiling) is UNREALISTIC because:
+
   ┌─────────────────────────────────────────────────────────────────────────────────────────────────┐
-  │  WHAT IS DEFENSIBLE                                                                            │
+  │  FACTOR 1: THE PRIVATE COMPANY PROBLEM                                                         │
   ├─────────────────────────────────────────────────────────────────────────────────────────────────┤
   │                                                                                                │
-  │  1. Mark-to-market taxation STRUCTURALLY eliminates the 4 largest avoidance channels           │
-  │     for publicly traded assets. This is not speculative — it's mechanical.                     │
-  │     Evidence: Senate Finance Committee analysis, CBPP, Equitable Growth.                       │
+  │  Only ~20% of billionaire wealth is in publicly traded, broker-reported assets.                │
+  │  The rest:                                                                                     │
+  │    ~35-40% — Private operating businesses (Koch Industries, Cargill, etc.)                    │
+  │    ~15-20% — Real estate, art, collectibles, complex partnerships                             │
+  │    ~10-15% — Private equity/hedge fund stakes with 3-10 year lockups                          │
+  │    ~5-10%  — Trusts with complex beneficial ownership                                         │
   │                                                                                                │
-  │  2. The exit tax (IRC 877A) makes emigration EXPENSIVE, not free.                              │
-  │     A $100B billionaire pays ~$13.3B to leave. Only 4,820 people renounced                     │
-  │     citizenship in 2024 — and most were NOT billionaires.                                      │
+  │  Private companies don't have market prices. Valuation requires:                               │
+  │    - Independent appraisals (manipulable: ±30% variance between appraisers)                   │
+  │    - Discounts for lack of marketability (DLOM): 15-35% legally accepted                      │
+  │    - Minority interest discounts: 20-40%                                                       │
+  │    - Combined discounts can reduce "value" by 40-60%                                           │
   │                                                                                                │
-  │  3. At 40% rate, EVEN the pessimistic regime generates meaningful revenue.                     │
-  │     Worst case (50% avoidance + 15% evasion): still ~$120B/year net.                           │
-  │     That's $120B that doesn't exist today. It accelerates the fund.                            │
+  │  The IRS has historically LOST most valuation disputes in Tax Court.                           │
+  │  Estate tax audit results show IRS accepts 70-80% of claimed discounts.                       │
   │                                                                                                │
-  │  4. The "severely reduced" avoidance regime (15% ceiling) IS achievable IF:                    │
-  │     - IRS enforcement is fully funded (not guaranteed post-2025 cuts)                          │
-  │     - Private company valuations are effectively policed                                       │
-  │     - Anti-abuse rules prevent reclassification from public to private                         │
-  │     These are design choices, not laws of nature.                                              │
+  │  CONCLUSION: Even with perfect public asset tracking, ~50%+ of the wealth                     │
+  │  base has genuine valuation uncertainty that billionaires WILL exploit.                        │
+  │  Near-zero avoidance on this portion is fantasy.                                              │
   │                                                                                                │
-  ├─────────────────────────────────────────────────────────────────────────────────────────────────┤
-  │  WHAT IS NOT DEFENSIBLE                                                                        │
+  │  REALISTIC ESTIMATE: 20-40% avoidance on private assets, 1-3% on public.                     │
+  │  Blended: 10-25% avoidance (at 40% rate).                                                    │
+  │                                                                                                │
+  └─────────────────────────────────────────────────────────────────────────────────────────────────┘
+
+  ┌─────────────────────────────────────────────────────────────────────────────────────────────────┐
+  │  FACTOR 2: THE INNOVATION PROBLEM                                                              │
   ├─────────────────────────────────────────────────────────────────────────────────────────────────┤
   │                                                                                                │
-  │  1. Assuming near-zero avoidance. Only ~20% of billionaire wealth is in                        │
-  │     publicly traded assets directly reachable by annual mark-to-market.                        │
-  │     ~50%+ is in private businesses with genuine valuation challenges.                          │
-  │     Pretending this problem doesn't exist produces fantasy revenue numbers.                    │
+  │  The US tax avoidance industry generates $50B+/year in fees.                                  │
+  │  When a new tax is imposed, the industry doesn't shut down — it innovates.                    │
   │                                                                                                │
-  │  2. Assuming avoidance is static. Billionaires will spend $1 to avoid                          │
-  │     $1.01 in taxes. The avoidance industry will innovate. The first few                        │
-  │     years may show high collection; later years will show adaptation.                          │
+  │  Mark-to-market eliminates the 4 biggest EXISTING channels.                                   │
+  │  But it creates NEW incentives:                                                               │
+  │    1. Take-public-to-private conversions (Dell 2013: went private, returned public)           │
+  │    2. Synthetic positions that mimic economic ownership without legal ownership                │
+  │    3. Move wealth into non-covered assets (real estate, crypto, foreign entities)              │
+  │    4. Complex trust structures designed around M2M rules                                       │
+  │    5. Negotiated payment plans / installment provisions that defer actual payment              │
   │                                                                                                │
-  │  3. Assuming IRS enforcement is permanent. The IRS has already lost 25%+                       │
-  │     of its workforce in 2025. Political cycles can gut enforcement.                            │
+  │  Historical pattern: every major tax reform faces 3-5 years of high compliance                │
+  │  followed by gradual erosion as new avoidance strategies emerge.                              │
   │                                                                                                │
-  │  4. Assuming the Supreme Court won't intervene. 4 of 9 justices signaled                      │
-  │     that taxing unrealized gains may require a constitutional amendment.                       │
-  │     Moore v. US (2024) left this door open.                                                    │
+  │  REALISTIC ESTIMATE: Add 5-10% to avoidance rates after Year 5.                               │
+  │  Near-zero stays near-zero for maybe 3 years, then rises to 10-15%.                          │
   │                                                                                                │
-  ├─────────────────────────────────────────────────────────────────────────────────────────────────┤
-  │  THE HONEST CENTRAL ESTIMATE                                                                   │
+  └─────────────────────────────────────────────────────────────────────────────────────────────────┘
+
+  ┌─────────────────────────────────────────────────────────────────────────────────────────────────┐
+  │  FACTOR 3: THE ENFORCEMENT SUSTAINABILITY PROBLEM                                              │
   ├─────────────────────────────────────────────────────────────────────────────────────────────────┤
   │                                                                                                │
-  │  The defensible range for avoidance at 40% rate is 15-50%.                                     │
-  │  Central estimate: ~25-30% avoidance, ~5% evasion → ~67-70% collection rate.                   │
+  │  Near-zero avoidance requires PERMANENT, WELL-FUNDED IRS enforcement.                         │
   │                                                                                                │
-  │  This is BETWEEN the "original" and "severely reduced" regimes.                                │
-  │  The original model's 55% collection at 40% rate was too pessimistic.                          │
-  │  The severely-reduced model's 85% collection is achievable but requires                        │
-  │  sustained political will for IRS enforcement.                                                 │
+  │  Reality check:                                                                                │
+  │    - IRS lost 25%+ of workforce by mid-2025 (political decision)                              │
+  │    - IRS $80B Inflation Reduction Act funding was clawed back to $58B                         │
+  │    - Enforcement funding is politically toxic ("weaponized IRS" narrative)                     │
+  │    - Every 4-8 years, political cycles can gut enforcement capacity                           │
+  │    - The IRS already has a $600B "tax gap" it cannot close                                    │
   │                                                                                                │
-  │  RECOMMENDED PLANNING ASSUMPTION: Use "original" regime as the FLOOR                           │
-  │  (what happens with weak enforcement) and "severely_reduced" as the                            │
-  │  CEILING (what's achievable with strong enforcement). Plan for the                             │
-  │  floor, aim for the ceiling.                                                                   │
+  │  The near-zero assumption requires:                                                            │
+  │    - Permanent 15%+ audit rate for >$10M earners                                              │
+  │    - Dedicated M2M enforcement division (new)                                                  │
+  │    - Real-time valuation infrastructure for private companies (new)                            │
+  │    - International cooperation on CRS/FATCA (fragile post-Trump)                              │
+  │                                                                                                │
+  │  This is NOT a technical problem — it's a POLITICAL problem.                                   │
+  │  The tax can be perfectly designed and still fail on enforcement.                              │
+  │                                                                                                │
+  │  REALISTIC ESTIMATE: Enforcement will be strong for ~4-8 years (launch                        │
+  │  momentum), then face cyclical degradation. Average enforcement over                          │
+  │  40 years will be ~60-75% of peak capacity.                                                   │
   │                                                                                                │
   └─────────────────────────────────────────────────────────────────────────────────────────────────┘
-""")
-
-    # === SECTION 6: SENSITIVITY — WHICH RATE + REGIME COMBOS HIT $500/mo BY YEAR 20? ===
-    print(f"{'━' * 105}")
-    print("  SECTION D: WHEN DOES TOTAL BENEFIT HIT $500/MONTH?")
-    print(f"{'━' * 105}")
-
-    print(f"\n  (SS Extension V2.0 + Billionaire Tax, 60/40 fund/Tier2 split)")
-    print(f"  {'Rate':<10}", end="")
-    for rk in ['pessimistic', 'original', 'severely_reduced', 'near_zero']:
-        print(f"  {BEHAVIORAL_REGIMES[rk]['name'][:18]:>20}", end="")
-    print()
-    print("  " + "─" * 90)
-
-    for rate in [0.20, 0.30, 0.40, 0.50, 0.60, 0.80, 1.00]:
-        print(f"  {rate:>5.0%}    ", end="")
-        cfg = WealthTaxConfig(
-            name=f'{rate:.0%}', description='',
-            income_tax_rate_above_1b=rate,
-            income_tax_rate_0_to_1b=rate * 0.5,
-            pct_to_equity_fund=0.60,
-            pct_to_tier2=0.40,
-        )
-        for rk in ['pessimistic', 'original', 'severely_reduced', 'near_zero']:
-            regime = BEHAVIORAL_REGIMES[rk]
-            opt = WealthTaxOptimizer(behavioral=regime['params'])
 
-            base_model = SSExtensionModelV2(scenario='moderate')
-            base = base_model.project(years=40)
-
-            wt_boost = np.zeros(40)
-            for t in range(40):
-                rev = opt.compute_annual_revenue(cfg, year=t)
-                wt_boost[t] = (rev['total_net_revenue'] * 0.40 / base['adults'][t]) / 12
-            total = base['total_monthly_adult'] + wt_boost
-
-            hit_500 = np.where(total >= 500)[0]
-            if len(hit_500) > 0:
-                print(f"  {'Year ' + str(hit_500[0]):>20}", end="")
-            else:
-                print(f"  {'>40 years':>20}", end="")
-        print()
+  ┌─────────────────────────────────────────────────────────────────────────────────────────────────┐
+  │  FACTOR 4: THE CONSTITUTIONAL TIME BOMB                                                        │
+  ├─────────────────────────────────────────────────────────────────────────────────────────────────┤
+  │                                                                                                │
+  │  Moore v. United States (2024):                                                                │
+  │    - Roberts CJ + 4: Upheld mandatory repatriation tax (narrow holding)                       │
+  │    - Thomas, Gorsuch (dissent): Unrealized gains cannot be "income"                            │
+  │    - Barrett (concurrence): Left door open for future challenge                                │
+  │    - Jackson (concurrence): Suggested broader taxing power                                     │
+  │                                                                                                │
+  │  Score: 4 justices definitely skeptical, 1 ambiguous, 4 likely supportive.                    │
+  │  One justice retirement/replacement could flip the outcome.                                    │
+  │                                                                                                │
+  │  If the Supreme Court strikes down M2M taxation:                                               │
+  │    - ALL avoidance/evasion modeling is moot — revenue goes to ZERO                            │
+  │    - The entire wealth tax component of the model disappears                                   │
+  │    - SS Extension V2.0 base model (no wealth tax) remains viable                              │
+  │                                                                                                │
+  │  REALISTIC ESTIMATE: ~30% probability of being struck down within 10 years.                    │
+  │  This risk CANNOT be reduced by better enforcement or design.                                  │
+  │  It requires either constitutional amendment or favorable court composition.                    │
+  │                                                                                                │
+  └─────────────────────────────────────────────────────────────────────────────────────────────────┘
 
-    print(f"\n  Without any wealth tax: $500/month reached at Year 34-35 (moderate scenario)")
+"""
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -1388,8 +1650,6 @@ def run_stress_test_near_zero():
 
     Conclusion: the honest central estimate for achievable revenue.
     """
-    from models.ss_extension_model import SSExtensionModelV2
-
     print("\n" + "=" * 105)
     print("  STRESS TEST: WHAT BREAKS IF AVOIDANCE APPROACHES ZERO?")
     print("  Testing the theoretical ceiling — and finding the honest floor")
@@ -1412,28 +1672,30 @@ def run_stress_test_near_zero():
     print(f"\n  {'Rate':>6} {'Gross Rev':>12} {'Net Rev':>12} {'$/adult/mo':>12} {'Fund@Y20':>12} {'Fund@Y30':>12}")
     print("  " + "─" * 66)
 
-    for rate in rates_to_test:
-        opt = WealthTaxOptimizer(behavioral=perfect)
-        cfg = WealthTaxConfig(
-            name=f'{rate:.0%}', description='',
-            income_tax_rate_above_1b=rate,
-            income_tax_rate_0_to_1b=rate * 0.5,
-            pct_to_equity_fund=0.60,
-            pct_to_tier2=0.40,
-        )
+    # One projection per rate is unavoidable; the printed metrics are then
+    # pulled from the stacked per-rate arrays in a single pass.
+    opt = WealthTaxOptimizer(behavioral=perfect)
+    gross = np.empty(len(rates_to_test))
+    net = np.empty(len(rates_to_test))
+    funds = []
+    for i, rate in enumerate(rates_to_test):
+        cfg = _cfg(rate)
         rev = opt.compute_annual_revenue(cfg, year=0)
         proj = opt.project_with_wealth_tax(cfg, years=40,
                                             base_fund_seed=500e9,
                                             base_annual_contribution=200e9,
                                             fund_return=0.04)
-
-        tier2_direct = (rev['total_net_revenue'] * 0.40 / 258e6) / 12
-
-        print(f"  {rate:>5.0%} ${rev['total_gross_revenue']/1e9:>10,.0f} "
-              f"${rev['total_net_revenue']/1e9:>10,.0f} "
-              f"${tier2_direct:>10,.0f} "
-              f"${proj['wt_fund'][20]/1e12:>10.1f}T "
-              f"${proj['wt_fund'][30]/1e12:>10.1f}T")
+        gross[i] = rev['total_gross_revenue']
+        net[i] = rev['total_net_revenue']
+        funds.append(proj['wt_fund'])
+
+    funds = np.stack(funds)
+    tier2_direct = (net * 0.40 / 258e6) / 12
+    ceiling_row = ("  {:>5.0%} ${:>10,.0f} ${:>10,.0f} ${:>10,.0f} "
+                   "${:>10.1f}T ${:>10.1f}T").format
+    print("\n".join(ceiling_row(*row) for row in zip(
+        rates_to_test, gross / 1e9, net / 1e9, tier2_direct,
+        funds[:, 20] / 1e12, funds[:, 30] / 1e12)))
 
     print(f"""
   KEY INSIGHT: At 40% with zero avoidance, gross = net = ~$258B/year.
@@ -1458,13 +1720,13 @@ def run_stress_test_near_zero():
   │                      │ Growth       │ Growth @40%  │ Growth @60%  │ Growth @100% │
   ├──────────────────────┼──────────────┼──────────────┼──────────────┼──────────────┤""")
 
-    for tier in BILLIONAIRE_TIERS:
-        g = tier.wealth_growth_rate
-        post_40 = g * (1 - 0.40)
-        post_60 = g * (1 - 0.60)
-        post_100 = g * (1 - 1.00)
-        print(f"  │  {tier.name:<20} │ {g:>10.1%}    │ {post_40:>10.1%}    │ "
-              f"{post_60:>10.1%}    │ {post_100:>10.1%}    │")
+    # Post-tax growth for every tier at 40% / 60% / 100%, formatted as one block
+    growth = TIER_ARR.growth
+    post_tax = growth[:, None] * (1 - np.array([0.40, 0.60, 1.00]))[None, :]
+    tier_row = ("  │  {:<20} │ {:>10.1%}    │ {:>10.1%}    │ "
+                "{:>10.1%}    │ {:>10.1%}    │").format
+    print("\n".join(tier_row(name, g, *post)
+                    for name, g, post in zip(TIER_ARR.names, growth, post_tax)))
 
     print(f"""  └──────────────────────┴──────────────┴──────────────┴──────────────┴──────────────┘
 
@@ -1491,29 +1753,16 @@ def run_stress_test_near_zero():
 
     print(f"\n  Total billionaire wealth over 40 years under different tax rates:")
     print(f"  (Assuming near-zero avoidance — theoretical maximum extraction)")
-    print(f"\n  {'Year':<6}", end="")
-    for rate in [0.0, 0.20, 0.40, 0.60, 0.80, 1.00]:
-        print(f" {'@'+str(int(rate*100))+'%':>10}", end="")
-    print()
+    traj_rates = np.array([0.0, 0.20, 0.40, 0.60, 0.80, 1.00])
+    print(f"\n  {'Year':<6}" + "".join(f" {'@'+str(int(rate*100))+'%':>10}"
+                                   for rate in traj_rates.tolist()))
     print("  " + "─" * 66)
 
-    wealth_trajectories = {}
-    for rate in [0.0, 0.20, 0.40, 0.60, 0.80, 1.00]:
-        trajectory = []
-        for year in range(41):
-            total_wealth = 0
-            for tier in BILLIONAIRE_TIERS:
-                # Post-tax growth rate
-                post_tax_growth = tier.wealth_growth_rate * (1 - rate)
-                total_wealth += tier.total_wealth * ((1 + post_tax_growth) ** year)
-            trajectory.append(total_wealth)
-        wealth_trajectories[rate] = trajectory
-
-    for t in [0, 5, 10, 15, 20, 30, 40]:
-        print(f"  {t:<6}", end="")
-        for rate in [0.0, 0.20, 0.40, 0.60, 0.80, 1.00]:
-            print(f" ${wealth_trajectories[rate][t]/1e12:>8.1f}T", end="")
-        print()
+    trajectories = _project_wealth(TIER_ARR.wealth, TIER_ARR.growth, traj_rates, 40)
+    wealth_trajectories = {rate: trajectories[i] for i, rate in enumerate(traj_rates.tolist())}
+
+    print("\n".join(f"  {t:<6}" + "".join(f" ${w:>8.1f}T" for w in trajectories[:, t] / 1e12)
+                    for t in [0, 5, 10, 15, 20, 30, 40]))
 
     print(f"""
   CRITICAL FINDING:
@@ -1532,113 +1781,7 @@ def run_stress_test_near_zero():
     print("  TEST 4: WHAT NEAR-ZERO AVOIDANCE IGNORES (THE HONEST CRITIQUE)")
     print(f"{'━' * 105}")
 
-    print(f"""
-  The near-zero avoidance assumption (1-5% ceiling) is UNREALISTIC because:
-
-  ┌─────────────────────────────────────────────────────────────────────────────────────────────────┐
-  │  FACTOR 1: THE PRIVATE COMPANY PROBLEM                                                         │
-  ├─────────────────────────────────────────────────────────────────────────────────────────────────┤
-  │                                                                                                │
-  │  Only ~20% of billionaire wealth is in publicly traded, broker-reported assets.                │
-  │  The rest:                                                                                     │
-  │    ~35-40% — Private operating businesses (Koch Industries, Cargill, etc.)                    │
-  │    ~15-20% — Real estate, art, collectibles, complex partnerships                             │
-  │    ~10-15% — Private equity/hedge fund stakes with 3-10 year lockups                          │
-  │    ~5-10%  — Trusts with complex beneficial ownership                                         │
-  │                                                                                                │
-  │  Private companies don't have market prices. Valuation requires:                               │
-  │    - Independent appraisals (manipulable: ±30% variance between appraisers)                   │
-  │    - Discounts for lack of marketability (DLOM): 15-35% legally accepted                      │
-  │    - Minority interest discounts: 20-40%                                                       │
-  │    - Combined discounts can reduce "value" by 40-60%                                           │
-  │                                                                                                │
-  │  The IRS has historically LOST most valuation disputes in Tax Court.                           │
-  │  Estate tax audit results show IRS accepts 70-80% of claimed discounts.                       │
-  │                                                                                                │
-  │  CONCLUSION: Even with perfect public asset tracking, ~50%+ of the wealth                     │
-  │  base has genuine valuation uncertainty that billionaires WILL exploit.                        │
-  │  Near-zero avoidance on this portion is fantasy.                                              │
-  │                                                                                                │
-  │  REALISTIC ESTIMATE: 20-40% avoidance on private assets, 1-3% on public.                     │
-  │  Blended: 10-25% avoidance (at 40% rate).                                                    │
-  │                                                                                                │
-  └─────────────────────────────────────────────────────────────────────────────────────────────────┘
-
-  ┌─────────────────────────────────────────────────────────────────────────────────────────────────┐
-  │  FACTOR 2: THE INNOVATION PROBLEM                                                              │
-  ├─────────────────────────────────────────────────────────────────────────────────────────────────┤
-  │                                                                                                │
-  │  The US tax avoidance industry generates $50B+/year in fees.                                  │
-  │  When a new tax is imposed, the industry doesn't shut down — it innovates.                    │
-  │                                                                                                │
-  │  Mark-to-market eliminates the 4 biggest EXISTING channels.                                   │
-  │  But it creates NEW incentives:                                                               │
-  │    1. Take-public-to-private conversions (Dell 2013: went private, returned public)           │
-  │    2. Synthetic positions that mimic economic ownership without legal ownership                │
-  │    3. Move wealth into non-covered assets (real estate, crypto, foreign entities)              │
-  │    4. Complex trust structures designed around M2M rules                                       │
-  │    5. Negotiated payment plans / installment provisions that defer actual payment              │
-  │                                                                                                │
-  │  Historical pattern: every major tax reform faces 3-5 years of high compliance                │
-  │  followed by gradual erosion as new avoidance strategies emerge.                              │
-  │                                                                                                │
-  │  REALISTIC ESTIMATE: Add 5-10% to avoidance rates after Year 5.                               │
-  │  Near-zero stays near-zero for maybe 3 years, then rises to 10-15%.                          │
-  │                                                                                                │
-  └─────────────────────────────────────────────────────────────────────────────────────────────────┘
-
-  ┌─────────────────────────────────────────────────────────────────────────────────────────────────┐
-  │  FACTOR 3: THE ENFORCEMENT SUSTAINABILITY PROBLEM                                              │
-  ├─────────────────────────────────────────────────────────────────────────────────────────────────┤
-  │                                                                                                │
-  │  Near-zero avoidance requires PERMANENT, WELL-FUNDED IRS enforcement.                         │
-  │                                                                                                │
-  │  Reality check:                                                                                │
-  │    - IRS lost 25%+ of workforce by mid-2025 (political decision)                              │
-  │    - IRS $80B Inflation Reduction Act funding was clawed back to $58B                         │
-  │    - Enforcement funding is politically toxic ("weaponized IRS" narrative)                     │
-  │    - Every 4-8 years, political cycles can gut enforcement capacity                           │
-  │    - The IRS already has a $600B "tax gap" it cannot close                                    │
-  │                                                                                                │
-  │  The near-zero assumption requires:                                                            │
-  │    - Permanent 15%+ audit rate for >$10M earners                                              │
-  │    - Dedicated M2M enforcement division (new)                                                  │
-  │    - Real-time valuation infrastructure for private companies (new)                            │
-  │    - International cooperation on CRS/FATCA (fragile post-Trump)                              │
-  │                                                                                                │
-  │  This is NOT a technical problem — it's a POLITICAL problem.                                   │
-  │  The tax can be perfectly designed and still fail on enforcement.                              │
-  │                                                                                                │
-  │  REALISTIC ESTIMATE: Enforcement will be strong for ~4-8 years (launch                        │
-  │  momentum), then face cyclical degradation. Average enforcement over                          │
-  │  40 years will be ~60-75% of peak capacity.                                                   │
-  │                                                                                                │
-  └─────────────────────────────────────────────────────────────────────────────────────────────────┘
-
-  ┌─────────────────────────────────────────────────────────────────────────────────────────────────┐
-  │  FACTOR 4: THE CONSTITUTIONAL TIME BOMB                                                        │
-  ├─────────────────────────────────────────────────────────────────────────────────────────────────┤
-  │                                                                                                │
-  │  Moore v. United States (2024):                                                                │
-  │    - Roberts CJ + 4: Upheld mandatory repatriation tax (narrow holding)                       │
-  │    - Thomas, Gorsuch (dissent): Unrealized gains cannot be "income"                            │
-  │    - Barrett (concurrence): Left door open for future challenge                                │
-  │    - Jackson (concurrence): Suggested broader taxing power                                     │
-  │                                                                                                │
-  │  Score: 4 justices definitely skeptical, 1 ambiguous, 4 likely supportive.                    │
-  │  One justice retirement/replacement could flip the outcome.                                    │
-  │                                                                                                │
-  │  If the Supreme Court strikes down M2M taxation:                                               │
-  │    - ALL avoidance/evasion modeling is moot — revenue goes to ZERO                            │
-  │    - The entire wealth tax component of the model disappears                                   │
-  │    - SS Extension V2.0 base model (no wealth tax) remains viable                              │
-  │                                                                                                │
-  │  REALISTIC ESTIMATE: ~30% probability of being struck down within 10 years.                    │
-  │  This risk CANNOT be reduced by better enforcement or design.                                  │
-  │  It requires either constitutional amendment or favorable court composition.                    │
-  │                                                                                                │
-  └─────────────────────────────────────────────────────────────────────────────────────────────────┘
-""")
+    sys.stdout.write(_NEAR_ZERO_CRITIQUE)
 
     # ─── TEST 5: THE HONEST FLOOR — WHAT CAN WE ACTUALLY COUNT ON? ─
     print(f"{'━' * 105}")
@@ -1672,13 +1815,7 @@ def run_stress_test_near_zero():
 
     for rate in rates_for_estimate:
         opt_realistic = WealthTaxOptimizer(behavioral=realistic)
-        cfg = WealthTaxConfig(
-            name='', description='',
-            income_tax_rate_above_1b=rate,
-            income_tax_rate_0_to_1b=rate * 0.5,
-            pct_to_equity_fund=0.60,
-            pct_to_tier2=0.40,
-        )
+        cfg = _cfg(rate)
         rev = opt_realistic.compute_annual_revenue(cfg, year=0)
         collect_pct = rev['total_net_revenue'] / max(rev['total_gross_revenue'], 1)
 
@@ -1697,29 +1834,16 @@ def run_stress_test_near_zero():
 
     # Now project the SS Extension with the realistic central estimate
     opt_central = WealthTaxOptimizer(behavioral=realistic)
-    cfg_40 = WealthTaxConfig(
-        name='40% realistic', description='',
-        income_tax_rate_above_1b=0.40,
-        income_tax_rate_0_to_1b=0.20,
-        pct_to_equity_fund=0.60,
-        pct_to_tier2=0.40,
-    )
+    cfg_40 = _cfg(0.40)
 
     base_model = SSExtensionModelV2(scenario='moderate')
     base = base_model.project(years=40)
 
-    # Compute with realistic behavioral response
-    wt_boost_realistic = np.zeros(40)
-    wt_revenue_realistic = np.zeros(40)
-    for t in range(40):
-        # Add enforcement degradation over time
-        # Enforcement starts strong, degrades 1%/year after Year 5
-        enforcement_factor = 1.0 if t <= 5 else max(0.70, 1.0 - 0.01 * (t - 5))
-
-        rev = opt_central.compute_annual_revenue(cfg_40, year=t)
-        adjusted_net = rev['total_net_revenue'] * enforcement_factor
-        wt_revenue_realistic[t] = adjusted_net
-        wt_boost_realistic[t] = (adjusted_net * 0.40 / base['adults'][t]) / 12
+    # Compute with realistic behavioral response and enforcement degradation
+    revs = np.fromiter((opt_central.compute_annual_revenue(cfg_40, year=t)['total_net_revenue']
+                        for t in range(40)), dtype=np.float64, count=40)
+    wt_revenue_realistic = revs * _enforcement_factor(40)
+    wt_boost_realistic = wt_revenue_realistic * (0.40 / (12.0 * base['adults']))
 
     total_realistic = base['total_monthly_adult'] + wt_boost_realistic
 
@@ -1739,17 +1863,17 @@ def run_stress_test_near_zero():
               f"${wt_revenue_realistic[t]/1e9:>10.0f}")
 
     # Find milestones
-    hit_500_realistic = np.where(total_realistic >= 500)[0]
-    hit_500_risk = np.where(total_risk_adj >= 500)[0]
-    hit_500_base = np.where(base['total_monthly_adult'] >= 500)[0]
+    hit_500_realistic = _first_ge(total_realistic, 500)
+    hit_500_risk = _first_ge(total_risk_adj, 500)
+    hit_500_base = _first_ge(base['total_monthly_adult'], 500)
 
     print(f"\n  $500/month milestone:")
     print(f"    Without wealth tax:                 "
-          f"{'Year ' + str(hit_500_base[0]) if len(hit_500_base) > 0 else '>40 years'}")
+          f"{'Year ' + str(hit_500_base) if hit_500_base >= 0 else '>40 years'}")
     print(f"    With 40% WT (central estimate):     "
-          f"{'Year ' + str(hit_500_realistic[0]) if len(hit_500_realistic) > 0 else '>40 years'}")
+          f"{'Year ' + str(hit_500_realistic) if hit_500_realistic >= 0 else '>40 years'}")
     print(f"    With 40% WT (risk-adjusted):        "
-          f"{'Year ' + str(hit_500_risk[0]) if len(hit_500_risk) > 0 else '>40 years'}")
+          f"{'Year ' + str(hit_500_risk) if hit_500_risk >= 0 else '>40 years'}")
 
     # Cumulative revenue
     cumulative_revenue = np.cumsum(wt_revenue_realistic)
@@ -1781,8 +1905,6 @@ def run_final_assessment():
     the enforcement reality, the constitutional risk. It produces a single
     defensible recommendation with confidence intervals.
     """
-    from models.ss_extension_model import SSExtensionModelV2
-
     print("\n" + "=" * 105)
     print("  FINAL CRITICAL ASSESSMENT: THE WEALTH TAX IN THE SS EXTENSION")
     print("  Synthesizing all evidence, all regimes, all stress tests")
@@ -1796,13 +1918,7 @@ def run_final_assessment():
     base_model = SSExtensionModelV2(scenario='moderate')
     base = base_model.project(years=40)
 
-    cfg_40 = WealthTaxConfig(
-        name='40%', description='',
-        income_tax_rate_above_1b=0.40,
-        income_tax_rate_0_to_1b=0.20,
-        pct_to_equity_fund=0.60,
-        pct_to_tier2=0.40,
-    )
+    cfg_40 = _cfg(0.40)
 
     # Add the realistic central estimate
     realistic = BehavioralResponse(
@@ -1888,18 +2004,19 @@ def run_final_assessment():
     # 2. Realistic central
     # 3. Pessimistic floor
 
-    realistic_total = np.zeros(40)
-    pessimistic_total = np.zeros(40)
-    for t in range(40):
-        # Realistic with enforcement degradation
-        enforcement = 1.0 if t <= 5 else max(0.70, 1.0 - 0.01 * (t - 5))
-        rev_r = opt_central.compute_annual_revenue(cfg_40, year=t)
-        boost_r = (rev_r['total_net_revenue'] * enforcement * 0.40 / base['adults'][t]) / 12
-        realistic_total[t] = base['total_monthly_adult'][t] + boost_r
+    revs_r = np.fromiter((opt_central.compute_annual_revenue(cfg_40, year=t)['total_net_revenue']
+                          for t in range(40)), dtype=np.float64, count=40)
+    revs_p = np.fromiter((opt_pessimistic.compute_annual_revenue(cfg_40, year=t)['total_net_revenue']
+                          for t in range(40)), dtype=np.float64, count=40)
+
+    tier2_per_dollar = 0.40 / (12.0 * base['adults'])
+
+    # Realistic with enforcement degradation
+    boost_r = revs_r * _enforcement_factor(40) * tier2_per_dollar
+    realistic_total = base['total_monthly_adult'] + boost_r
 
-        rev_p = opt_pessimistic.compute_annual_revenue(cfg_40, year=t)
-        boost_p = (rev_p['total_net_revenue'] * 0.40 / base['adults'][t]) / 12
-        pessimistic_total[t] = base['total_monthly_adult'][t] + boost_p
+    boost_p = revs_p * tier2_per_dollar
+    pessimistic_total = base['total_monthly_adult'] + boost_p
 
     print(f"""
   ┌─────────────────────────────────────────────────────────────────────────────────────────────────┐
@@ -2005,12 +2122,12 @@ def run_final_assessment():
               f"${pessimistic_total[t]:>14,.0f}  │  ${realistic_total[t]:>14,.0f}  │"
               f"{'':>26}│")
 
-    hit_500_base = np.where(base['total_monthly_adult'] >= 500)[0]
-    hit_500_pess = np.where(pessimistic_total >= 500)[0]
-    hit_500_real = np.where(realistic_total >= 500)[0]
+    hit_500_base = _first_ge(base['total_monthly_adult'], 500)
+    hit_500_pess = _first_ge(pessimistic_total, 500)
+    hit_500_real = _first_ge(realistic_total, 500)
 
     print(f"""  ├──────────┼────────────────┼────────────────────┼────────────────────┤                          │
-  │ $500/mo  │  {"Year " + str(hit_500_base[0]) if len(hit_500_base) > 0 else ">40 yrs":>12}  │  {"Year " + str(hit_500_pess[0]) if len(hit_500_pess) > 0 else ">40 yrs":>16}  │  {"Year " + str(hit_500_real[0]) if len(hit_500_real) > 0 else ">40 yrs":>16}  │                          │
+  │ $500/mo  │  {"Year " + str(hit_500_base) if hit_500_base >= 0 else ">40 yrs":>12}  │  {"Year " + str(hit_500_pess) if hit_500_pess >= 0 else ">40 yrs":>16}  │  {"Year " + str(hit_500_real) if hit_500_real >= 0 else ">40 yrs":>16}  │                          │
   └──────────┴────────────────┴────────────────────┴────────────────────┘                          │
   └─────────────────────────────────────────────────────────────────────────────────────────────────┘
 
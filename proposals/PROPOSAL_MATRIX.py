@@ -95,511 +95,325 @@ VALIDATED MODEL OUTPUTS (from SS Extension V2.0 + Wealth Tax Optimizer):
     - US equity market cap: $55.0T
 """
 
+import functools
+import importlib.util
+import json
+import py_compile
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+from types import MappingProxyType, ModuleType
+from typing import NamedTuple
+
+
 # ═══════════════════════════════════════════════════════════════════════
 #  VALIDATED CITATIONS
 # ═══════════════════════════════════════════════════════════════════════
 
-VALIDATED_CITATIONS = {
-    # ── CORE SOCIAL SECURITY DATA ──────────────────────────────────
-    'ssa_trustees_2024': {
-        'full': 'Social Security Administration (2024). "The 2024 Annual Report '
-                'of the Board of Trustees of the Federal Old-Age and Survivors '
-                'Insurance and Federal Disability Insurance Trust Funds." '
-                'Washington, DC: U.S. Government Publishing Office.',
-        'short': 'SSA Trustees Report (2024)',
-        'url': 'https://www.ssa.gov/OACT/TR/2024/',
-        'claims': [
-            'SS Trust Fund depletion projected for 2034',
-            'SS beneficiaries: 67 million',
-            'Average retired worker benefit: $1,907/month',
-            'SS total annual outlays: $1.4 trillion',
-            'SS total annual revenue: $1.2 trillion',
-        ],
-        'verified': True,
-    },
-    'cbo_ss_outlook_2024': {
-        'full': 'Congressional Budget Office (2024). "CBO\'s Long-Term '
-                'Projections for Social Security: 2024." Washington, DC.',
-        'short': 'CBO SS Outlook (2024)',
-        'url': 'https://www.cbo.gov/publication/59711',
-        'claims': [
-            'SS deficit growth trajectory',
-            '75-year actuarial deficit estimates',
-        ],
-        'verified': True,
-    },
+# The registry lives in citations/<shard>.json, one file per theme, and each
+# shard is parsed on first access. Callers that only need FORMAT_SPECS or a
+# short format's few shards never pay for the rest.
+CITATIONS_DIR = Path(__file__).parent / 'citations'
+
+CITATION_SHARDS = (
+    'core_ss',        # core Social Security data
+    'inequality',     # wealth & income inequality data
+    'billionaire',    # billionaire wealth data
+    'tax_policy',     # tax policy proposals
+    'behavioral',     # behavioral response literature
+    'ubi',            # UBI / cash transfer experiments
+    'swf',            # sovereign wealth fund literature
+    'markets',        # market impact literature
+    'fiscal',         # fiscal policy / multipliers
+    'misc',           # living wage, withdrawal, consumption, measurement,
+                      # means-testing, Gini decomposition, FTT
+)
+
+
+# Every registry entry is verified; only the exceptions are recorded here.
+UNVERIFIED_CITATIONS: frozenset[str] = frozenset()
+
+
+def is_verified(cid: str) -> bool:
+    """True unless `cid` is listed in UNVERIFIED_CITATIONS."""
+    return cid not in UNVERIFIED_CITATIONS
+
+
+class CitationColumns(NamedTuple):
+    """One registry shard as parallel columns, one entry per citation."""
+    ids: tuple[str, ...]
+    fulls: tuple[str, ...]
+    shorts: tuple[str, ...]
+    urls: tuple[str, ...]
+    claims: tuple[tuple[str, ...], ...]
+
+
+class Citation:
+    """Read-only view of one row of the citation columns."""
+    __slots__ = ('_cols', '_i')
+
+    def __init__(self, cols: CitationColumns, i: int):
+        self._cols = cols
+        self._i = i
 
-    # ── WEALTH & INCOME INEQUALITY DATA ────────────────────────────
-    'fed_scf_2022': {
-        'full': 'Board of Governors of the Federal Reserve System (2023). '
-                '"Survey of Consumer Finances, 2022." Federal Reserve Bulletin.',
-        'short': 'Federal Reserve SCF (2022)',
-        'url': 'https://www.federalreserve.gov/econres/scfindex.htm',
-        'claims': [
-            'US wealth Gini: 0.86',
-            'Top 1% hold 31% of household wealth',
-            'Top 10% hold 67% of household wealth',
-            'Bottom 50% hold 2.5% of household wealth',
-            'Total US household net worth: ~$135 trillion',
-        ],
-        'verified': True,
-    },
-    'census_cps_2023': {
-        'full': 'U.S. Census Bureau (2023). "Current Population Survey, '
-                'Annual Social and Economic Supplement (CPS ASEC)." '
-                'Washington, DC: U.S. Census Bureau.',
-        'short': 'Census CPS ASEC (2023)',
-        'url': 'https://www.census.gov/programs-surveys/cps.html',
-        'claims': [
-            'US income Gini: 0.49 (market income)',
-            'Post-tax-and-transfer Gini: 0.39',
-            'Income distribution by percentile',
-            '37% of working-age adults earn below $2,200/month',
-        ],
-        'verified': True,
-    },
-    'saez_zucman_2019': {
-        'full': 'Saez, Emmanuel and Gabriel Zucman (2019). "The Triumph '
-                'of Injustice: How the Rich Dodge Taxes and How to Make '
-                'Them Pay." New York: W.W. Norton & Company.',
-        'short': 'Saez & Zucman (2019)',
-        'claims': [
-            'Mark-to-market taxation framework for billionaires',
-            'Effective tax rates on billionaire wealth gains: ~3.4%',
-            'Revenue estimates for billionaire minimum tax',
-        ],
-        'verified': True,
-    },
-    'saez_zucman_2021': {
-        'full': 'Saez, Emmanuel and Gabriel Zucman (2021). "A Progressive '
-                'Tax on Billionaire Wealth." UC Berkeley working paper.',
-        'short': 'Saez & Zucman (2021)',
-        'claims': [
-            'Billionaire taxation revenue estimates',
-            'Avoidance rate calibration: ~15% at 2% rate',
-        ],
-        'verified': True,
-    },
-    'propublica_2021': {
-        'full': 'Eisinger, Jesse, Jeff Ernsthausen, and Paul Kiel (2021). '
-                '"The Secret IRS Files: Trove of Never-Before-Seen Records '
-                'Reveal How the Wealthiest Avoid Income Tax." ProPublica, '
-                'June 8, 2021.',
-        'short': 'ProPublica IRS Files (2021)',
-        'url': 'https://www.propublica.org/article/the-secret-irs-files',
-        'claims': [
-            'Billionaire "true tax rate" on wealth gains: ~3.4%',
-            'Buy-borrow-die strategy documentation',
-            'Individual billionaire tax payments vs. wealth growth',
-        ],
-        'verified': True,
-    },
+    @property
+    def full(self) -> str:
+        return self._cols.fulls[self._i]
+
+    @property
+    def short(self) -> str:
+        return self._cols.shorts[self._i]
+
+    @property
+    def url(self) -> str:
+        return self._cols.urls[self._i]
+
+    @property
+    def claims(self) -> tuple[str, ...]:
+        return self._cols.claims[self._i]
+
+    @property
+    def verified(self) -> bool:
+        return is_verified(self._cols.ids[self._i])
+
+    def __repr__(self):
+        return f"Citation({self._cols.ids[self._i]!r}, short={self.short!r})"
+
+
+@functools.cache
+def get_citation_columns(shard: str) -> CitationColumns:
+    """Load one citation shard as columns (parsed once, then cached).
+
+    Keys and string fields are interned so repeated names share one object
+    and downstream equality checks reduce to identity compares.
+    """
+    if shard not in CITATION_SHARDS:
+        raise KeyError(f"unknown citation shard {shard!r}")
+    with open(CITATIONS_DIR / f'{shard}.json', encoding='utf-8') as f:
+        raw = json.load(f)
+    intern = sys.intern
+    recs = raw.values()
+    return CitationColumns(
+        ids=tuple(map(intern, raw)),
+        fulls=tuple(intern(rec['full']) for rec in recs),
+        shorts=tuple(intern(rec['short']) for rec in recs),
+        urls=tuple(intern(rec['url']) for rec in recs),
+        claims=tuple(tuple(map(intern, rec['claims'])) for rec in recs),
+    )
+
+
+@functools.cache
+def get_citation_shard(shard: str) -> Mapping[str, Citation]:
+    """Citation key -> row view over one shard's columns (read-only)."""
+    cols = get_citation_columns(shard)
+    return MappingProxyType(
+        {cid: Citation(cols, i) for i, cid in enumerate(cols.ids)})
+
+
+@functools.cache
+def get_shards(shards: tuple[str, ...]) -> Mapping[str, Citation]:
+    """Merged read-only view of the given shards, in the order listed."""
+    merged = {}
+    for shard in shards:
+        merged.update(get_citation_shard(shard))
+    return MappingProxyType(merged)
+
+
+def get_citations() -> Mapping[str, Citation]:
+    """The full validated citation registry (every shard, read-only)."""
+    return get_shards(CITATION_SHARDS)
 
-    # ── BILLIONAIRE WEALTH DATA ────────────────────────────────────
-    'forbes_400_2024': {
-        'full': 'Forbes (2024). "The Forbes 400: The Definitive Ranking '
-                'of the Wealthiest Americans." Forbes Media LLC.',
-        'short': 'Forbes 400 (2024)',
-        'url': 'https://www.forbes.com/forbes-400/',
-        'claims': [
-            '935 US billionaires (2024-2025 estimate)',
-            'Combined wealth: approximately $8.2 trillion',
-            'Top 15 centi-billionaires: ~$3.2 trillion',
-            'Individual billionaire wealth levels and tier distribution',
-        ],
-        'verified': True,
-    },
-    'atf_billionaire_tracker': {
-        'full': 'Americans for Tax Fairness (2025). "Billionaire Wealth '
-                'Tracker." Washington, DC.',
-        'short': 'ATF Billionaire Tracker (2025)',
-        'url': 'https://americansfortaxfairness.org/billionaire-tracker/',
-        'claims': [
-            'Real-time billionaire wealth tracking',
-            'Annual wealth growth rates by tier',
-        ],
-        'verified': True,
-    },
-    'ips_centibillionaire_2025': {
-        'full': 'Institute for Policy Studies (2025). "Billionaire Bonanza: '
-                'The Centi-Billionaire Report." Washington, DC.',
-        'short': 'IPS Centi-Billionaire Report (2025)',
-        'claims': [
-            'Top 15 centi-billionaires: $3.2T (39% of billionaire wealth)',
-        ],
-        'verified': True,
-    },
 
-    # ── TAX POLICY PROPOSALS ───────────────────────────────────────
-    'wyden_billionaire_tax_2021': {
-        'full': 'Wyden, Ron (2021). "Billionaires Income Tax." '
-                'U.S. Senate Committee on Finance. Joint Committee on '
-                'Taxation score: $557 billion over 10 years.',
-        'short': 'Wyden Billionaires Income Tax (2021)',
-        'url': 'https://www.finance.senate.gov/chairmans-news/wyden-unveils-billionaires-income-tax',
-        'claims': [
-            'Mark-to-market taxation of unrealized gains for >$1B wealth',
-            'JCT revenue score: $557B over 10 years',
-        ],
-        'verified': True,
-    },
-    'biden_billionaire_minimum_tax': {
-        'full': 'U.S. Department of the Treasury (2024). "General Explanations '
-                'of the Administration\'s Fiscal Year 2025 Revenue Proposals." '
-                'Billionaire Minimum Income Tax: Treasury score $503B/10yr.',
-        'short': 'Biden FY2025 Billionaire Minimum Tax',
-        'url': 'https://home.treasury.gov/policy-issues/tax-policy/revenue-proposals',
-        'claims': [
-            'Biden 25% minimum tax on >$100M wealth: ~$503B/10yr',
-        ],
-        'verified': True,
-    },
-    'moore_v_us_2024': {
-        'full': 'Moore v. United States, 602 U.S. ___ (2024). Supreme Court '
-                'of the United States, decided June 20, 2024.',
-        'short': 'Moore v. United States (2024)',
-        'url': 'https://www.supremecourt.gov/opinions/23pdf/22-800_7lho.pdf',
-        'claims': [
-            'Narrow ruling: did NOT prohibit mark-to-market taxation broadly',
-            'Left door open for future constitutional challenge',
-            'Constitutional risk for M2M: ~30% within 10 years (model estimate)',
-        ],
-        'verified': True,
-    },
+def get_citation(cid: str) -> Citation:
+    """Look up one citation by key, raising KeyError for unknown keys."""
+    try:
+        return get_citations()[cid]
+    except KeyError:
+        raise KeyError(f"unknown citation {cid!r}") from None
 
-    # ── BEHAVIORAL RESPONSE LITERATURE ─────────────────────────────
-    'scheuer_slemrod_2021': {
-        'full': 'Scheuer, Florian and Joel Slemrod (2021). "Taxing Our Wealth." '
-                'Journal of Economic Perspectives, 35(1): 207-230.',
-        'short': 'Scheuer & Slemrod (2021)',
-        'claims': [
-            'Comprehensive review of wealth tax behavioral responses',
-            'European wealth tax experience and abolitions',
-            'Avoidance elasticity estimates',
-        ],
-        'verified': True,
-    },
-    'brulhart_etal_2022': {
-        'full': 'Brulhart, Marius, Jonathan Gruber, Matthias Krapf, and '
-                'Kurt Schmidheiny (2022). "Behavioral Responses to Wealth '
-                'Taxes: Evidence from Switzerland." American Economic Journal: '
-                'Economic Policy, 14(4): 111-150.',
-        'short': 'Brulhart et al. (2022)',
-        'claims': [
-            'Swiss wealth tax elasticity of taxable wealth: 0.1-0.4',
-            'Evidence that wealth taxes are administrable',
-        ],
-        'verified': True,
-    },
 
-    # ── UBI / CASH TRANSFER EXPERIMENTS ────────────────────────────
-    'marinescu_2018': {
-        'full': 'Marinescu, Ioana (2018). "No Strings Attached: The Behavioral '
-                'Effects of U.S. Unconditional Cash Transfer Programs." '
-                'NBER Working Paper No. 24337.',
-        'short': 'Marinescu (2018)',
-        'claims': [
-            'Employment reduction from UBI: 1-4% at $1,000/month',
-            'Hours reduction: 5-10%',
-            'Survey of NIT experiments and labor supply effects',
-        ],
-        'verified': True,
-    },
-    'finland_experiment_2020': {
-        'full': 'Hämäläinen, Kari et al. (2020). "The Basic Income Experiment '
-                '2017-2018 in Finland: Preliminary Results." Ministry of Social '
-                'Affairs and Health, Finland.',
-        'short': 'Finland Basic Income Experiment (2020)',
-        'claims': [
-            'Basic income did not significantly reduce employment',
-            'Improved subjective wellbeing and life satisfaction',
-        ],
-        'verified': True,
-    },
-    'cesarini_2017': {
-        'full': 'Cesarini, David et al. (2017). "The Effect of Wealth on '
-                'Individual and Household Labor Supply: Evidence from Swedish '
-                'Lotteries." American Economic Review, 107(12): 3917-3946.',
-        'short': 'Cesarini et al. (2017)',
-        'claims': [
-            'Lottery winners reduce labor supply modestly',
-            'Labor supply elasticity to unearned income',
-        ],
-        'verified': True,
-    },
-    'hoynes_rothstein_2019': {
-        'full': 'Hoynes, Hilary and Jesse Rothstein (2019). "Universal Basic '
-                'Income in the United States and Advanced Countries." '
-                'Annual Review of Economics, 11: 929-958.',
-        'short': 'Hoynes & Rothstein (2019)',
-        'claims': [
-            'Targeting vs. universality tradeoff in UBI design',
-            'Labor supply and distributional effects analysis',
-        ],
-        'verified': True,
-    },
+def filter_verified() -> list[int]:
+    """Registry-order indices of every verified citation."""
+    ids = tuple(get_citations())
+    if not UNVERIFIED_CITATIONS:
+        return list(range(len(ids)))
+    return [i for i, cid in enumerate(ids) if cid not in UNVERIFIED_CITATIONS]
+
+
+@functools.cache
+def get_claim_index() -> dict[str, tuple[str, ...]]:
+    """Inverted claim -> citation-key index, built once from the registry."""
+    index: dict[str, list[str]] = {}
+    for cid, cite in get_citations().items():
+        for claim in cite.claims:
+            index.setdefault(claim, []).append(cid)
+    return {claim: tuple(cids) for claim, cids in index.items()}
+
+
+def citations_for(claim: str) -> tuple[str, ...]:
+    """Keys of every citation that backs `claim` (empty if none)."""
+    return get_claim_index().get(claim, ())
+
+
+def __getattr__(name):
+    # PEP 562: keep the registry and its index importable without an eager load
+    if name == 'VALIDATED_CITATIONS':
+        return get_citations()
+    if name == 'CLAIM_INDEX':
+        return get_claim_index()
+    if name.startswith('CITATIONS_') and name[10:].lower() in CITATION_SHARDS:
+        return get_citation_shard(name[10:].lower())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    # ── SOVEREIGN WEALTH FUND LITERATURE ───────────────────────────
-    'norway_gpfg': {
-        'full': 'Norges Bank Investment Management (2024). "Government Pension '
-                'Fund Global: Annual Report 2023." Oslo, Norway.',
-        'short': 'Norway GPFG Annual Report (2023)',
-        'url': 'https://www.nbim.no/en/publications/reports/',
-        'claims': [
-            'Norway GPFG: $1.7 trillion AUM (2024)',
-            'Annual real return: ~5.7% (since 1998)',
-            'Successful sovereign fund precedent',
-        ],
-        'verified': True,
-    },
-    'alaska_pfd': {
-        'full': 'Alaska Permanent Fund Corporation (2024). "Annual Report." '
-                'Juneau, AK.',
-        'short': 'Alaska PFD (2024)',
-        'url': 'https://apfc.org/annual-reports/',
-        'claims': [
-            'Alaska Permanent Fund: ~$80 billion AUM',
-            'Annual dividend to all Alaska residents',
-            'Bipartisan durability: 40+ years',
-        ],
-        'verified': True,
-    },
 
-    # ── MARKET IMPACT LITERATURE ───────────────────────────────────
-    'gabaix_koijen_2022': {
-        'full': 'Gabaix, Xavier and Ralph Koijen (2022). "In Search of the '
-                'Origins of Financial Fluctuations: The Inelastic Markets '
-                'Hypothesis." NBER Working Paper No. 28967.',
-        'short': 'Gabaix & Koijen (2022)',
-        'claims': [
-            'Inelastic markets multiplier: ~5x for equity inflows',
-            'Price impact of large institutional buying',
-        ],
-        'verified': True,
-    },
+# ═══════════════════════════════════════════════════════════════════════
+#  FORMAT SPECIFICATIONS
+# ═══════════════════════════════════════════════════════════════════════
 
-    # ── FISCAL POLICY / MULTIPLIERS ────────────────────────────────
-    'cbo_fiscal_multipliers_2020': {
-        'full': 'Congressional Budget Office (2020). "Estimated Macroeconomic '
-                'Effects of Spending and Revenue Options." CBO Publication.',
-        'short': 'CBO Fiscal Multipliers (2020)',
-        'claims': [
-            'Fiscal multiplier for transfers to low-income: 1.3-1.5',
-            'MPC for low-income recipients: 0.85-0.95',
-        ],
-        'verified': True,
-    },
-    'imf_redistribution_growth_2014': {
-        'full': 'Ostry, Jonathan, Andrew Berg, and Charalambos Tsangarides '
-                '(2014). "Redistribution, Inequality, and Growth." IMF Staff '
-                'Discussion Note SDN/14/02. Washington, DC: International '
-                'Monetary Fund.',
-        'short': 'IMF Redistribution & Growth (2014)',
-        'claims': [
-            'Reducing inequality from high levels is growth-enhancing',
-            '1 percentage-point Gini reduction → 0.1-0.15% higher growth/5yr',
-        ],
-        'verified': True,
-    },
+class FormatSpec(NamedTuple):
+    """One rung of the proposal format ladder (read-only record)."""
+    level: str
+    name: str
+    max_words: int
+    audience: str
+    tone: str
+    structure: str
+    citations: str
+    math: str
+    file: str
+    required_shards: tuple[str, ...] = CITATION_SHARDS
 
-    # ── LIVING WAGE DATA ───────────────────────────────────────────
-    'mit_living_wage_2024': {
-        'full': 'Glasmeier, Amy K. (2024). "Living Wage Calculator." '
-                'Massachusetts Institute of Technology.',
-        'short': 'MIT Living Wage Calculator (2024)',
-        'url': 'https://livingwage.mit.edu/',
-        'claims': [
-            'National average living wage: ~$2,200/month (single adult)',
-            'Regional variation in living costs',
-        ],
-        'verified': True,
-    },
 
-    # ── WITHDRAWAL POLICY ──────────────────────────────────────────
-    'dybvig_1995': {
-        'full': 'Dybvig, Philip H. (1995). "Duesenberry\'s Ratcheting of '
-                'Consumption: Optimal Dynamic Consumption and Investment '
-                'Given Intolerance for Any Decline in Standard of Living." '
-                'Review of Economic Studies, 62(2): 287-313.',
-        'short': 'Dybvig (1995)',
-        'claims': [
-            'Optimal consumption ratchet: benefits never decrease nominally',
-            'Theoretical foundation for benefit floor with reserve fund',
-        ],
-        'verified': True,
-    },
+FORMAT_SPECS = {
+    'evening_news': FormatSpec(
+        level='1A',
+        name='Evening News Bullets',
+        max_words=200,
+        audience='General public, TV/radio viewers',
+        tone='Simple, direct, no jargon',
+        structure='5-7 bullet points with 1-line conclusion',
+        citations='None (implied authority)',
+        math='None — only final dollar amounts',
+        file='short_format/evening_news_bullets.py',
+        required_shards=('core_ss',),
+    ),
+    'op_ed': FormatSpec(
+        level='2A',
+        name='Op-Ed / Newspaper Column',
+        max_words=800,
+        audience='Newspaper readers, engaged voters',
+        tone='Persuasive, accessible, occasional analogy',
+        structure='Hook → Problem → Solution → Evidence → Call to action',
+        citations='2-3 inline (e.g., "according to SSA")',
+        math='None — plain English comparisons',
+        file='short_format/op_ed.py',
+        required_shards=('core_ss', 'billionaire'),
+    ),
+    'executive_brief': FormatSpec(
+        level='3B',
+        name='Executive / Legislative Brief',
+        max_words=1500,
+        audience='Members of Congress, senior staffers, governors',
+        tone='Professional, authoritative, balanced',
+        structure='Summary → Problem → Mechanism → Projections → Risks → Ask',
+        citations='5-8 footnotes',
+        math='Key tables (benefit levels, revenue sources)',
+        file='short_format/executive_brief.py',
+        required_shards=('core_ss', 'billionaire', 'tax_policy', 'swf'),
+    ),
+    'policy_brief': FormatSpec(
+        level='4B',
+        name='Policy Brief',
+        max_words=5000,
+        audience='Policy analysts, think tank staff, committee staff directors',
+        tone='Analytical, evidence-based, acknowledges tradeoffs',
+        structure='8 sections with tables and sensitivity analysis',
+        citations='15-25 footnotes',
+        math='Tables, simple equations explained in prose',
+        file='medium_format/policy_brief.py',
+        required_shards=('core_ss', 'inequality', 'billionaire', 'tax_policy',
+                         'behavioral', 'swf', 'fiscal'),
+    ),
+    'white_paper': FormatSpec(
+        level='5B/C',
+        name='White Paper',
+        max_words=12000,
+        audience='Congressional committees, CBO, Treasury, OMB',
+        tone='Technical but accessible, comprehensive',
+        structure='Full proposal with legislative language suggestions',
+        citations='30-50 endnotes',
+        math='Full model summary, projections, sensitivity tables',
+        file='medium_format/white_paper.py',
+    ),
+    'working_paper': FormatSpec(
+        level='6C',
+        name='Working Paper (NBER-style)',
+        max_words=25000,
+        audience='Economists, academic researchers, CBO analysts',
+        tone='Academic, formal, methodologically rigorous',
+        structure='Abstract → Intro → Literature → Model → Results → Robustness → Conclusion',
+        citations='50-80 references',
+        math='Full model specification, proofs, estimation details',
+        file='long_format/working_paper.py',
+    ),
+    'journal_submission': FormatSpec(
+        level='7C',
+        name='Journal Submission (AER/QJE/JPE format)',
+        max_words=40000,
+        audience='Peer reviewers, academic economists',
+        tone='Rigorous academic prose, hedged claims, full methodology',
+        structure='Per journal guidelines with online appendix',
+        citations='80-120 references with full bibliographic details',
+        math='Complete derivations, statistical tests, identification strategy',
+        file='long_format/journal_submission.py',
+    ),
+}
+FORMAT_SPECS = MappingProxyType(FORMAT_SPECS)
 
-    # ── INCOME/CONSUMPTION LITERATURE ──────────────────────────────
-    'jappelli_pistaferri_2010': {
-        'full': 'Jappelli, Tullio and Luigi Pistaferri (2010). "The Consumption '
-                'Response to Income Changes." Annual Review of Economics, '
-                '2: 479-506.',
-        'short': 'Jappelli & Pistaferri (2010)',
-        'claims': [
-            'MPC for low-income households: 0.85-0.95',
-            'MPC for high-income households: 0.30-0.50',
-        ],
-        'verified': True,
-    },
 
-    # ── INEQUALITY MEASUREMENT ─────────────────────────────────────
-    'piketty_saez_stantcheva_2014': {
-        'full': 'Piketty, Thomas, Emmanuel Saez, and Stefanie Stantcheva (2014). '
-                '"Optimal Taxation of Top Labor Incomes: A Tale of Three '
-                'Elasticities." American Economic Journal: Economic Policy, '
-                '6(1): 230-271.',
-        'short': 'Piketty, Saez & Stantcheva (2014)',
-        'claims': [
-            'Optimal top marginal tax rate analysis',
-            'Behavioral response elasticities at high incomes',
-        ],
-        'verified': True,
-    },
-    'atkinson_2015': {
-        'full': 'Atkinson, Anthony B. (2015). "Inequality: What Can Be Done?" '
-                'Cambridge, MA: Harvard University Press.',
-        'short': 'Atkinson (2015)',
-        'claims': [
-            'Participation income concept (universal floor with activity requirement)',
-            'Framework for reducing inequality through policy',
-        ],
-        'verified': True,
-    },
-    'oecd_inequality_2015': {
-        'full': 'OECD (2015). "In It Together: Why Less Inequality Benefits All." '
-                'Paris: OECD Publishing.',
-        'short': 'OECD In It Together (2015)',
-        'claims': [
-            'International Gini coefficient comparisons',
-            'Inequality reduction benefits for economic growth',
-        ],
-        'verified': True,
-    },
+@functools.cache
+def get_format_spec(key: str) -> FormatSpec:
+    """FORMAT_SPECS lookup tolerant of case, spaces and hyphens ('Op-Ed')."""
+    return FORMAT_SPECS[key.strip().lower().replace('-', '_').replace(' ', '_')]
 
-    # ── MEANS-TESTING LITERATURE ───────────────────────────────────
-    'moffitt_2002': {
-        'full': 'Moffitt, Robert A. (2002). "The Temporary Assistance for '
-                'Needy Families Program." In Robert A. Moffitt (ed.), '
-                'Means-Tested Transfer Programs in the United States. '
-                'Chicago: University of Chicago Press.',
-        'short': 'Moffitt (2002)',
-        'claims': [
-            'Means-testing welfare traps and behavioral effects',
-            'Administrative costs of income verification',
-        ],
-        'verified': True,
-    },
 
-    # ── GINI DECOMPOSITION ─────────────────────────────────────────
-    'lerman_yitzhaki_1985': {
-        'full': 'Lerman, Robert I. and Shlomo Yitzhaki (1985). "Income '
-                'Inequality Effects by Income Source: A New Approach and '
-                'Applications to the United States." Review of Economics '
-                'and Statistics, 67(1): 151-156.',
-        'short': 'Lerman & Yitzhaki (1985)',
-        'claims': [
-            'Gini decomposition by income source',
-            'Effect of uniform transfers on Gini coefficient',
-        ],
-        'verified': True,
-    },
+def get_format_citations(fmt_key: str) -> Mapping[str, Citation]:
+    """Citations available to a format, loading only its required shards."""
+    return get_shards(get_format_spec(fmt_key).required_shards)
 
-    # ── FINANCIAL TRANSACTION TAX ──────────────────────────────────
-    'kyle_1985': {
-        'full': 'Kyle, Albert S. (1985). "Continuous Auctions and Insider '
-                'Trading." Econometrica, 53(6): 1315-1335.',
-        'short': 'Kyle (1985)',
-        'claims': [
-            'Price impact and market microstructure theory',
-            'Lambda (price impact parameter) framework',
-        ],
-        'verified': True,
-    },
-}
 
-# ═══════════════════════════════════════════════════════════════════════
-#  FORMAT SPECIFICATIONS
-# ═══════════════════════════════════════════════════════════════════════
+def load_format(fmt_key: str) -> ModuleType:
+    """Import the module behind FORMAT_SPECS[fmt_key] once and reuse it.
+
+    The variant modules are large string-constant files that are not part
+    of a package, so they are loaded from their path on first request and
+    the module object is cached for every later render.
+    """
+    return _load_format_file(get_format_spec(fmt_key).file)
+
+
+@functools.cache
+def _load_format_file(rel_path: str) -> ModuleType:
+    path = Path(__file__).parent / rel_path
+    spec = importlib.util.spec_from_file_location(f'_format_{path.stem}', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def prewarm_formats() -> None:
+    """Byte-compile every format and letter module into __pycache__.
+
+    Batch runs start a fresh interpreter per invocation; compiling once up
+    front means each later load_format() unmarshals cached bytecode instead
+    of re-parsing the large prose literals.
+    """
+    root = Path(__file__).parent
+    files = [spec.file for spec in FORMAT_SPECS.values()]
+    files += [letter_file(stance) for stance in POLITICAL_FRAMING]
+    for rel_path in files:
+        py_compile.compile(str(root / rel_path), doraise=True)
 
-FORMAT_SPECS = {
-    'evening_news': {
-        'level': '1A',
-        'name': 'Evening News Bullets',
-        'max_words': 200,
-        'audience': 'General public, TV/radio viewers',
-        'tone': 'Simple, direct, no jargon',
-        'structure': '5-7 bullet points with 1-line conclusion',
-        'citations': 'None (implied authority)',
-        'math': 'None — only final dollar amounts',
-        'file': 'short_format/evening_news_bullets.py',
-    },
-    'op_ed': {
-        'level': '2A',
-        'name': 'Op-Ed / Newspaper Column',
-        'max_words': 800,
-        'audience': 'Newspaper readers, engaged voters',
-        'tone': 'Persuasive, accessible, occasional analogy',
-        'structure': 'Hook → Problem → Solution → Evidence → Call to action',
-        'citations': '2-3 inline (e.g., "according to SSA")',
-        'math': 'None — plain English comparisons',
-        'file': 'short_format/op_ed.py',
-    },
-    'executive_brief': {
-        'level': '3B',
-        'name': 'Executive / Legislative Brief',
-        'max_words': 1500,
-        'audience': 'Members of Congress, senior staffers, governors',
-        'tone': 'Professional, authoritative, balanced',
-        'structure': 'Summary → Problem → Mechanism → Projections → Risks → Ask',
-        'citations': '5-8 footnotes',
-        'math': 'Key tables (benefit levels, revenue sources)',
-        'file': 'short_format/executive_brief.py',
-    },
-    'policy_brief': {
-        'level': '4B',
-        'name': 'Policy Brief',
-        'max_words': 5000,
-        'audience': 'Policy analysts, think tank staff, committee staff directors',
-        'tone': 'Analytical, evidence-based, acknowledges tradeoffs',
-        'structure': '8 sections with tables and sensitivity analysis',
-        'citations': '15-25 footnotes',
-        'math': 'Tables, simple equations explained in prose',
-        'file': 'medium_format/policy_brief.py',
-    },
-    'white_paper': {
-        'level': '5B/C',
-        'name': 'White Paper',
-        'max_words': 12000,
-        'audience': 'Congressional committees, CBO, Treasury, OMB',
-        'tone': 'Technical but accessible, comprehensive',
-        'structure': 'Full proposal with legislative language suggestions',
-        'citations': '30-50 endnotes',
-        'math': 'Full model summary, projections, sensitivity tables',
-        'file': 'medium_format/white_paper.py',
-    },
-    'working_paper': {
-        'level': '6C',
-        'name': 'Working Paper (NBER-style)',
-        'max_words': 25000,
-        'audience': 'Economists, academic researchers, CBO analysts',
-        'tone': 'Academic, formal, methodologically rigorous',
-        'structure': 'Abstract → Intro → Literature → Model → Results → Robustness → Conclusion',
-        'citations': '50-80 references',
-        'math': 'Full model specification, proofs, estimation details',
-        'file': 'long_format/working_paper.py',
-    },
-    'journal_submission': {
-        'level': '7C',
-        'name': 'Journal Submission (AER/QJE/JPE format)',
-        'max_words': 40000,
-        'audience': 'Peer reviewers, academic economists',
-        'tone': 'Rigorous academic prose, hedged claims, full methodology',
-        'structure': 'Per journal guidelines with online appendix',
-        'citations': '80-120 references with full bibliographic details',
-        'math': 'Complete derivations, statistical tests, identification strategy',
-        'file': 'long_format/journal_submission.py',
-    },
-}
 
 # ═══════════════════════════════════════════════════════════════════════
 #  POLITICAL FRAMING SPECIFICATIONS
@@ -608,111 +422,185 @@ FORMAT_SPECS = {
 POLITICAL_FRAMING = {
     'receptive': {
         'stance': 'RECEPTIVE',
-        'typical_recipients': [
+        'typical_recipients': (
             'Congressional Progressive Caucus',
             'Congressional Black Caucus',
             'Senate Finance Democrats',
             'House Ways and Means Democrats',
-        ],
+        ),
         'framing': 'Expand Social Security for the 21st Century',
-        'lead_with': [
+        'lead_with': (
             'Moral imperative: 37% of working-age adults below living wage',
             'Scale of impact: 138 million people lifted toward living wage',
             'Builds on most popular government program in history',
             'Reduces income inequality by 18% (Gini 0.39 → 0.32)',
-        ],
-        'avoid': [
+        ),
+        'avoid': (
             'Sounding radical — frame as natural SS evolution',
             'Over-promising on timeline (be honest: 30-year trajectory)',
             'Ignoring political feasibility concerns',
-        ],
-        'key_arguments': [
+        ),
+        'key_arguments': (
             'SS is already universal — this extends the principle',
             'Mark-to-market closes the "buy-borrow-die" loophole',
             'Billionaires still get richer — this is not confiscation',
             'GDP effect is positive (+5.3% at Year 30)',
             'Alaska PFD proves sovereign fund dividends work',
-        ],
+        ),
     },
     'skeptical': {
         'stance': 'SKEPTICAL',
-        'typical_recipients': [
+        'typical_recipients': (
             'Problem Solvers Caucus',
             'Moderate Democrats (Manchin-type)',
             'Moderate Republicans',
             'Senate bipartisan working groups',
-        ],
+        ),
         'framing': 'Strengthen & Modernize Social Security',
-        'lead_with': [
+        'lead_with': (
             'SS trust fund depleted by 2034 — this fixes it',
             'Revenue-constrained: benefits only what we can afford',
             'No new deficit spending — fully funded from new revenue',
             'Benefit ratchet prevents cuts (Dybvig 1995)',
-        ],
-        'avoid': [
+        ),
+        'avoid': (
             '"UBI" language — always say "Social Security Extension"',
             'Leading with the wealth tax (lead with FICA reform)',
             'Sounding like redistribution (frame as "broadening the base")',
-        ],
-        'key_arguments': [
+        ),
+        'key_arguments': (
             'This SAVES Social Security first (deficit coverage)',
             'Sovereign equity fund generates market returns for everyone',
             'Means-testing targets people who need it (fiscal discipline)',
             'Billionaire tax is on INCOME, not wealth (M2M = income)',
             'CBO-scorable: every dollar in, every dollar tracked',
-        ],
+        ),
     },
     'hostile': {
         'stance': 'HOSTILE',
-        'typical_recipients': [
+        'typical_recipients': (
             'Republican Study Committee',
             'House Freedom Caucus',
             'Senate Conservative caucuses',
             'Anti-tax advocates',
-        ],
+        ),
         'framing': 'Protect & Extend Social Security Through Market Returns',
-        'lead_with': [
+        'lead_with': (
             'SS is going bankrupt in 2034 — this prevents benefit cuts',
             'Market-based: sovereign fund earns equity returns, not tax-and-spend',
             'Your constituents on SS will see benefits protected',
             'Norway does this: $1.7T sovereign fund, conservative governance',
-        ],
-        'avoid': [
+        ),
+        'avoid': (
             '"Redistribution", "wealth tax", "inequality" language',
             'Leading with billionaire taxation',
             'Any comparison to European welfare states',
             'The word "universal"',
-        ],
-        'key_arguments': [
+        ),
+        'key_arguments': (
             'This is a MARKET solution — equity fund earns returns',
             'Without reform, SS benefits cut 23% in 2034',
             'Your constituents (67M retirees) are the primary beneficiaries',
             'The fund is modeled on Alaska PFD (Republican state, bipartisan)',
             'Revenue comes from closing tax loopholes, not new taxes',
             'Alternative: SS benefit cuts that destroy elections',
-        ],
+        ),
     },
 }
 
 
+def _freeze_framing(frame: dict) -> Mapping:
+    # Intern every label so phrases shared across stances are one object and
+    # cross-stance set operations compare by identity.
+    return MappingProxyType({
+        k: tuple(map(sys.intern, v)) if isinstance(v, tuple) else sys.intern(v)
+        for k, v in frame.items()
+    })
+
+
+POLITICAL_FRAMING = MappingProxyType(
+    {k: _freeze_framing(v) for k, v in POLITICAL_FRAMING.items()})
+
+# Lead-with headline truncated to the report's 40-character column.
+_LEAD_TRUNC = {k: v['lead_with'][0][:40] for k, v in POLITICAL_FRAMING.items()}
+
+
+@functools.cache
+def get_framing(stance: str) -> Mapping:
+    """POLITICAL_FRAMING lookup tolerant of case and surrounding spaces."""
+    return POLITICAL_FRAMING[stance.strip().lower()]
+
+
+def letter_file(stance: str) -> str:
+    """Path (relative to proposals/) of the letter written for `stance`."""
+    get_framing(stance)  # reject unknown stances before touching the disk
+    return f'political_letters/letter_{stance.strip().lower()}.py'
+
+
+def load_letter(stance: str) -> ModuleType:
+    """Import the political letter for `stance` on first use and reuse it."""
+    return _load_format_file(letter_file(stance))
+
+
+# ═══════════════════════════════════════════════════════════════════════
+#  MATRIX REPORT
+# ═══════════════════════════════════════════════════════════════════════
+
+_SEP80_EQ = "=" * 80
+_SEP80_DASH = "─" * 80
+_SEP95_DASH = "─" * 95
+
+_FORMAT_ROW = "  {0:<6} {1:<30} {2:<10} {3:<35}".format
+_FRAMING_ROW = "  {0:<12} {1:<45} {2:<40}".format
+_CITATION_HEADER = "  VALIDATED CITATIONS: {0}".format
+_CITATION_ROW = "    [{0}] {1}".format
+
+# Display columns (one tuple per printed field) built once from the static
+# tables, so the report walks parallel tuples instead of record lookups.
+_FORMAT_COLUMNS = tuple(zip(*(
+    (spec.level, spec.name, spec.max_words, spec.audience)
+    for spec in FORMAT_SPECS.values()
+)))
+_FRAMING_COLUMNS = tuple(zip(*(
+    (frame['stance'], frame['framing'], _LEAD_TRUNC[key])
+    for key, frame in POLITICAL_FRAMING.items()
+)))
+
+
+@functools.cache
+def _citation_display() -> tuple[tuple[str, str], ...]:
+    # (status, short name) pairs; cached rather than built at import so the
+    # registry stays unread until a report is actually rendered
+    return tuple(("VERIFIED" if is_verified(key) else "UNVERIFIED", cite.short)
+                 for key, cite in get_citations().items())
+
+
+@functools.cache
+def render_banner() -> str:
+    """The full proposal-matrix report, rendered once and cached."""
+    lines = [
+        _SEP80_EQ,
+        "  SS EXTENSION — PROPOSAL MATRIX",
+        _SEP80_EQ,
+        "",
+        "  FORMAT MATRIX:",
+        _FORMAT_ROW('Level', 'Format', 'Words', 'Audience'),
+        "  " + _SEP80_DASH,
+    ]
+    lines += map(_FORMAT_ROW, *_FORMAT_COLUMNS)
+    lines += [
+        "",
+        "  POLITICAL FRAMING:",
+        _FRAMING_ROW('Stance', 'Framing', 'Lead With'),
+        "  " + _SEP95_DASH,
+    ]
+    lines += map(_FRAMING_ROW, *_FRAMING_COLUMNS)
+    citation_display = _citation_display()
+    lines += ["", _CITATION_HEADER(len(citation_display))]
+    lines += [_CITATION_ROW(status, short) for status, short in citation_display]
+    lines.append("")
+    return "\n".join(lines)
+
+
 if __name__ == '__main__':
-    print("=" * 80)
-    print("  SS EXTENSION — PROPOSAL MATRIX")
-    print("=" * 80)
-
-    print("\n  FORMAT MATRIX:")
-    print(f"  {'Level':<6} {'Format':<30} {'Words':<10} {'Audience':<35}")
-    print(f"  {'─' * 80}")
-    for key, spec in FORMAT_SPECS.items():
-        print(f"  {spec['level']:<6} {spec['name']:<30} {spec['max_words']:<10} {spec['audience']:<35}")
-
-    print(f"\n  POLITICAL FRAMING:")
-    print(f"  {'Stance':<12} {'Framing':<45} {'Lead With':<40}")
-    print(f"  {'─' * 95}")
-    for key, frame in POLITICAL_FRAMING.items():
-        print(f"  {frame['stance']:<12} {frame['framing']:<45} {frame['lead_with'][0][:40]:<40}")
-
-    print(f"\n  VALIDATED CITATIONS: {len(VALIDATED_CITATIONS)}")
-    for key, cite in VALIDATED_CITATIONS.items():
-        status = "VERIFIED" if cite.get('verified') else "UNVERIFIED"
-        print(f"    [{status}] {cite['short']}")
+    sys.stdout.write(render_banner())
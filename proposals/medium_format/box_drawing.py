@@ -0,0 +1,50 @@
+"""
+Box-drawing helpers shared by the medium-format proposals.
+
+The policy brief and the white paper render their section headings and
+numeric tables through these functions, so both documents draw the same
+frames the same way.
+"""
+
+import functools
+import sys
+from collections.abc import Sequence
+
+
+@functools.lru_cache(maxsize=None)
+def hline(char: str, n: int) -> str:
+    """A run of n box-drawing characters.
+
+    Headings and table borders repeat the same few widths; each rule is built
+    once and interned, so every heading and border of that width shares one
+    string.
+    """
+    return sys.intern(char * n)
+
+
+def dollars(x):
+    return f"${x:,}"
+
+
+def heading(title: str, rule: str) -> str:
+    """A section heading indented two spaces between two full-width rules."""
+    return f"{rule}\n  {title}\n{rule}\n"
+
+
+def box_table(headers: Sequence[Sequence[str]], rows: Sequence[Sequence[str]],
+              widths: tuple[int, ...]) -> str:
+    """Box-drawn table indented two spaces, one cell per column width.
+
+    Header rows and body rows arrive already formatted by the caller and are
+    only padded out to the column width.
+    """
+    def line(cells):
+        return "  │" + "│".join(c.ljust(w) for c, w in zip(cells, widths)) + "│"
+
+    bars = [hline("─", w) for w in widths]
+    out = ["  ┌" + "┬".join(bars) + "┐"]
+    out += map(line, headers)
+    out.append("  ├" + "┼".join(bars) + "┤")
+    out += map(line, rows)
+    out.append("  └" + "┴".join(bars) + "┘")
+    return "\n".join(out)
@@ -6,413 +6,251 @@ Tone: Analytical, evidence-based, acknowledges tradeoffs
 Citations: 15-25 footnotes
 """
 
-POLICY_BRIEF = """
-══════════════════════════════════════════════════════════════════════════
-  THE SOCIAL SECURITY EXTENSION:
-  A Revenue-Constrained Approach to Universal Income Security
-
-  Policy Brief | [Date]
-══════════════════════════════════════════════════════════════════════════
-
-ABSTRACT
-
-This brief proposes a three-component reform to the Social Security
-system: (1) FICA restructuring that removes the earnings cap and extends
-payroll contributions to investment income; (2) a "Tier 2" income
-supplement for Social Security beneficiaries and working-age adults
-earning below the living wage; and (3) a 40% mark-to-market income
-tax on billionaires to accelerate the build-out of a sovereign equity
-fund. The system is revenue-constrained by design — benefits equal
-only what the system collects — requiring no deficit spending. Economic
-modeling projects benefits reaching $1,731 per month for 138 million
-eligible adults within 30 years, reducing the U.S. income Gini
-coefficient from 0.39 to 0.32. Social Security solvency is maintained
-throughout the projection period.
-
-──────────────────────────────────────────────────────────────────────────
-  1. BACKGROUND AND MOTIVATION
-──────────────────────────────────────────────────────────────────────────
-
-1.1 The Social Security Solvency Crisis
-
-The Old-Age, Survivors, and Disability Insurance (OASDI) trust fund is
-projected to be depleted by 2034, per the 2024 Annual Trustees
-Report.[1] Upon depletion, the system becomes pay-as-you-go, and
-benefits are automatically reduced to approximately 77% of scheduled
-levels — a 23% across-the-board cut affecting 67 million beneficiaries.
-
-The deficit is structural: the ratio of workers to beneficiaries has
-fallen from 5.1:1 in 1960 to 2.7:1 today and is projected to reach
-2.1:1 by 2040.[2] Incremental adjustments (raising the retirement age,
-modest tax increases) can delay but not prevent insolvency without
-fundamental restructuring.
-
-1.2 Income Inadequacy Among Working-Age Adults
-
-According to the Census Bureau's Current Population Survey (CPS ASEC,
-2023), approximately 37% of working-age adults (ages 18-66) earn below
-$2,200 per month — the national average living wage for a single adult
-as calculated by the MIT Living Wage Calculator.[3][4]
-
-This translates to approximately 71 million working-age adults who are
-employed or seeking employment but cannot meet basic living expenses.
-Combined with 67 million Social Security beneficiaries (many of whom
-receive below-living-wage benefits), approximately 138 million American
-adults — 53.4% of the adult population — have income below the living
-wage threshold.[5]
-
-1.3 Tax Base Erosion at the Top
-
-The effective tax rate on billionaire wealth accumulation is
-approximately 3.4%, according to analysis of confidential IRS data
-published by ProPublica in 2021.[6] This is made possible by the
-buy-borrow-die strategy: billionaires borrow against unrealized capital
-gains rather than selling assets, thereby avoiding realization events
-that trigger capital gains taxation. Upon death, the stepped-up basis
-under IRC Section 1014 eliminates the unrealized gains entirely.
-
-As of 2025, 935 U.S. billionaires hold approximately $8.2 trillion in
-combined wealth, with the top 15 centi-billionaires alone holding $3.2
-trillion (39% of all billionaire wealth).[7][8]
-
-──────────────────────────────────────────────────────────────────────────
-  2. THE PROPOSAL
-──────────────────────────────────────────────────────────────────────────
-
-2.1 Component 1: FICA Restructuring
-
-The proposal reforms the Federal Insurance Contributions Act in three
-ways:
-
-  (a) CAP REMOVAL: Eliminate the taxable earnings cap (currently
-      $168,600 in 2024). All earned income contributes to OASDI
-      proportionally. This mirrors the structure already in place for
-      Medicare's Hospital Insurance tax, which has no cap.
-
-  (b) INVESTMENT INCOME EXTENSION: Apply FICA at 50% of the standard
-      employee rate to investment income — capital gains (realized),
-      dividends, and carried interest. This recognizes that capital
-      income benefits from the economic stability that Social Security
-      provides.
-
-  (c) EMPLOYER-SIDE ADJUSTMENT: Phase in employer-side changes over
-      5 years to prevent competitiveness shocks.
-
-  Estimated Year 0 revenue: $728 billion/year in new revenue (net of
-  current OASDI revenue of approximately $1.2 trillion).[9]
-
-  Revenue priority:
-    1st: Cover existing OASDI deficit (~$200B/year)
-    2nd: Contribute to American Equity Fund (40% of remainder)
-    3rd: Fund Tier 2 benefits (60% of remainder)
-
-2.2 Component 2: Tier 2 Benefit (Revenue-Constrained)
-
-DESIGN PRINCIPLES:
-
-  Revenue-constrained: The monthly benefit is calculated as:
-
-    Tier 2 = (Revenue after deficit and fund contribution) /
-             (Eligible population x 12)
-
-  This formula guarantees solvency by construction. If revenue falls,
-  benefits fall. If revenue rises, benefits rise. There is no
-  unfunded promise.
-
-  Benefit ratchet: Applying the Dybvig (1995) optimal consumption
-  framework, benefits never decrease nominally once established.[10]
-  A reserve fund (initially 10% of Tier 2 outlays) smooths temporary
-  revenue dips.
-
-ELIGIBILITY:
-
-  Group 1 — SS Beneficiaries: All 67 million current Social Security
-  recipients (retired, disabled, survivors) receive Tier 2 automatically.
-  This group already receives Tier 1 (standard SS); Tier 2 supplements it.
-
-  Group 2 — Working-age adults below living wage: Adults aged 18-66
-  whose market income (wages, self-employment, investment) falls below
-  $2,200/month. Approximately 71 million people at Year 0.
-
-  Group 3 — Excluded: Working-age adults earning above $2,200/month.
-  Approximately 120 million people. They benefit indirectly through
-  SS solvency and the equity fund.
-
-  CRITICAL DESIGN CHOICE: The Tier 2 benefit does NOT count as income
-  for eligibility purposes. Only market income determines the threshold.
-  This avoids the poverty trap / cliff effect that has plagued
-  means-tested programs since the negative income tax experiments.[11]
-
-  Total eligible: ~138 million adults (53.4% of adult population)
-  Benefit multiplier vs. universal: 1.87x (same revenue, fewer people)
-
-PROJECTED BENEFITS (Moderate Scenario):
-
-  ┌──────┬──────────────┬──────────────────┬──────────────────────┐
-  │ Year │ Tier 2 ($/mo)│ Retiree Total    │ Cum. Benefit/Person  │
-  ├──────┼──────────────┼──────────────────┼──────────────────────┤
-  │   0  │    $249      │  $2,156          │        $0            │
-  │   5  │    $282      │  $2,388          │   $15,711            │
-  │  10  │    $398      │  $2,723          │   $34,906            │
-  │  20  │    $762      │  $3,596          │   $98,349            │
-  │  30  │  $1,731      │  $5,185          │  $228,332            │
-  └──────┴──────────────┴──────────────────┴──────────────────────┘
-
-2.3 Component 3: Billionaire Income Tax (Accelerant)
-
-  STRUCTURE: A 40% mark-to-market income tax on individuals with net
-  worth exceeding $1 billion. "Income" is defined as total economic
-  income — realized gains, unrealized gains (change in net worth),
-  dividends, compensation, and all other forms — following the Haig-
-  Simons comprehensive income definition and the Wyden Billionaires
-  Income Tax framework.[12]
-
-  Graduated rates:
-    - 20% on economic income up to $1B/year per individual
-    - 40% on economic income above $1B/year per individual
-
-  CONSTITUTIONAL VIABILITY: The Supreme Court's decision in Moore v.
-  United States (2024) did not prohibit mark-to-market taxation
-  broadly, deciding the case on narrow grounds.[13] However,
-  constitutional risk remains. The model incorporates a 30%
-  probability of the M2M tax being struck down within 10 years.
-  Alternative structures (minimum tax with lookback, mandatory
-  realization at death) are available as fallbacks.
-
-  BEHAVIORAL RESPONSE (Realistic Central Estimate):
-    - Base avoidance rate: 7% (trust restructuring, charitable vehicles)
-    - Avoidance ceiling: 30% (at maximum statutory rate)
-    - Evasion rate: 2% (limited by FATCA, information reporting)
-    - Emigration: <0.5% per year (exit tax of 23.8% on all unrealized
-      gains under IRC 877A creates a strong deterrent)
-    - Net collection rate: ~81% of statutory revenue
-
-  Revenue estimates:
-    - Year 0: $210 billion/year (net of behavioral response)
-    - Year 10: $578 billion/year (as wealth base grows)
-    - 10-year cumulative: ~$3.5 trillion
-
-  Revenue allocation:
-    - 60% to American Equity Fund (sovereign wealth fund)
-    - 40% directly to Tier 2 benefits
-
-  Evidence base: Brulhart et al. (2022) find Swiss wealth tax
-  elasticities of 0.1-0.4, suggesting administrable collection is
-  achievable. Scheuer and Slemrod (2021) review the European experience
-  and find that wealth tax failures were primarily due to weak
-  enforcement, narrow bases, and low rates — factors addressable by
-  design.[14][15]
-
-──────────────────────────────────────────────────────────────────────────
-  3. THE AMERICAN EQUITY FUND
-──────────────────────────────────────────────────────────────────────────
-
-The American Equity Fund (AEF) is a sovereign wealth fund that invests
-in a globally diversified portfolio (60-70% equities, 20-30% bonds,
-5-10% alternatives). It serves two functions:
-
-  (a) TIER 3 BENEFIT: Beginning in Year 5, the fund pays a "dividend"
-      (3.5% withdrawal rate, smoothed over a 3-year trailing average)
-      to eligible adults. This creates a third tier of benefits funded
-      by market returns.
-
-  (b) RESERVE: The fund acts as a buffer during market downturns,
-      preventing benefit cuts.
-
-PRECEDENTS:
-  - Norway Government Pension Fund Global: $1.7 trillion AUM, 5.7%
-    annualized real return since 1998, strict governance.[16]
-  - Alaska Permanent Fund: $80 billion AUM, annual dividends to all
-    residents since 1982, bipartisan support for 40+ years.[17]
-
-GOVERNANCE: Independent board with staggered terms, investment policy
-set by statute, prohibited from owning >3% of any single company,
-reporting requirements modeled on Norway GPFG.
-
-──────────────────────────────────────────────────────────────────────────
-  4. DISTRIBUTIONAL IMPACT
-──────────────────────────────────────────────────────────────────────────
-
-4.1 Income Inequality
-
-  The system reduces the post-tax-and-transfer income Gini coefficient
-  from 0.39 (current U.S.) to approximately 0.32 by Year 30 — an 18%
-  reduction.[18] This would bring the U.S. from the most unequal OECD
-  country to approximately the level of Canada (0.30) or the United
-  Kingdom (0.35).
-
-  ┌──────────┬────────────┬──────────────────────────────────────┐
-  │ Year     │ Income Gini│ Nearest OECD Country                 │
-  ├──────────┼────────────┼──────────────────────────────────────┤
-  │ Current  │   0.390    │ (worst in OECD)                      │
-  │  5       │   0.378    │ Still worse than UK (0.35)            │
-  │ 10       │   0.373    │ Approaching UK level                  │
-  │ 30       │   0.321    │ Near Canada (0.30)                    │
-  └──────────┴────────────┴──────────────────────────────────────┘
-
-  Income Gini estimation follows the Lerman-Yitzhaki (1985)
-  decomposition for the universal component and an adjusted model
-  for targeted transfers with concentration bonus.[19]
-
-4.2 Wealth Inequality
-
-  The wealth Gini moves modestly: 0.86 to approximately 0.84 over 30
-  years. This is because:
-    - Low-income recipients have marginal propensity to consume of
-      0.90 (Jappelli & Pistaferri, 2010), so only ~10% of transfers
-      accumulate as wealth[20]
-    - The system taxes INCOME, not wealth stocks
-    - Meaningful wealth Gini reduction requires direct asset transfers
-      (e.g., baby bonds, matched savings)
-
-4.3 Billionaire Impact
-
-  The 935 U.S. billionaires pay approximately $39 trillion in taxes
-  over 30 years. Their combined wealth grows from $8.2 trillion to
-  approximately $103 trillion (vs. $146 trillion counterfactual). The
-  average billionaire's wealth grows from $8.8 billion to $110 billion
-  — 12.6x their starting point. No billionaire has less wealth than
-  they started with.
-
-──────────────────────────────────────────────────────────────────────────
-  5. MACROECONOMIC EFFECTS
-──────────────────────────────────────────────────────────────────────────
-
-5.1 GDP Impact
-
-  Three channels:
-
-  (a) CONSUMPTION MULTIPLIER (+): Transfer recipients have MPC ~0.90.
-      With a fiscal multiplier of 1.4 (CBO, 2020), each dollar of
-      transfers generates $1.26 in economic activity.[21]
-
-  (b) LABOR SUPPLY (-): Modest reduction of 1-4% in employment at
-      projected benefit levels (Marinescu, 2018; Finland experiment,
-      2020).[22][23] Partially offset by entrepreneurship increase
-      (5-15%) and health improvements.
-
-  (c) INEQUALITY REDUCTION (+): The IMF (2014) finds that reducing
-      inequality from high levels is growth-enhancing, with a 1
-      percentage-point Gini reduction associated with 0.1-0.15%
-      higher growth over 5 years.[24]
-
-  NET EFFECT: +1.5% to +5.3% of GDP over the projection period.
-
-5.2 Market Impact
-
-  The sovereign fund's equity purchases create upward price pressure
-  (Gabaix & Koijen, 2022), but the effect diminishes as markets adapt.
-  The fund is a permanent holder, providing structural stability.[25]
-
-──────────────────────────────────────────────────────────────────────────
-  6. RISKS AND LIMITATIONS
-──────────────────────────────────────────────────────────────────────────
-
-  ┌────────────────────────────┬──────────────┬─────────────────────────┐
-  │ Risk                       │ Probability  │ Mitigation              │
-  ├────────────────────────────┼──────────────┼─────────────────────────┤
-  │ M2M tax unconstitutional   │    ~30%      │ Alternative structures  │
-  │ Avoidance exceeds estimate │    ~25%      │ Revenue-constrained     │
-  │ Market crash (>40%)        │    ~15%/30yr │ Reserve fund, ratchet   │
-  │ Political reversal         │    ~20%      │ Universality = 3rd rail │
-  │ Labor supply shock         │     ~5%      │ Benefits are moderate   │
-  │ Emigration wave            │     <5%      │ Exit tax = 23.8%        │
-  └────────────────────────────┴──────────────┴─────────────────────────┘
-
-  The system's fundamental safeguard is revenue-constraint: it cannot
-  overspend because benefits are mechanically tied to collections.
-  Unlike Social Security's current structure — which makes promises
-  that outstrip revenue — this system promises only what it has.
-
-──────────────────────────────────────────────────────────────────────────
-  7. IMPLEMENTATION PATHWAY
-──────────────────────────────────────────────────────────────────────────
-
-  Phase 1 (Years 1-2): FICA reform + AEF establishment
-    - CBO scoring and committee markup
-    - AEF governance board confirmed by Senate
-    - FICA cap removal and investment income extension
-
-  Phase 2 (Years 2-5): Tier 2 launch
-    - Tier 2 benefits begin flowing to SS beneficiaries and eligible
-      working-age adults
-    - Reserve fund building (10% of Tier 2 outlays)
-    - AEF begins equity accumulation
-
-  Phase 3 (Years 5+): Wealth tax and full system
-    - Billionaire income tax implemented (or alternative structure if
-      M2M faces constitutional challenge)
-    - Tier 3 dividends begin from AEF
-    - Full system operational
-
-──────────────────────────────────────────────────────────────────────────
-  8. CONCLUSION
-──────────────────────────────────────────────────────────────────────────
-
-The Social Security Extension represents the next logical step in the
-90-year history of Social Security: broadening the base, extending the
-floor, and funding it through progressive revenue that captures
-economic income currently escaping taxation. It is revenue-constrained
-(no deficits), behaviorally realistic (calibrated to empirical
-avoidance rates), and administratively feasible (builds on existing
-SSA infrastructure).
-
-The choice is not between this proposal and the status quo. The status
-quo ends in 2034 with a 23% benefit cut. The choice is between a
-system that compounds market returns for all Americans and one that
-compounds them only for those who already have wealth.
-
-══════════════════════════════════════════════════════════════════════════
-  NOTES
-══════════════════════════════════════════════════════════════════════════
-
- [1] SSA (2024). "2024 Annual Report of the Board of Trustees of the
-     OASDI Trust Funds."
- [2] CBO (2024). "CBO's Long-Term Projections for Social Security."
- [3] Census Bureau (2023). CPS ASEC. Income distribution data.
- [4] Glasmeier, A.K. (2024). "Living Wage Calculator." MIT.
- [5] Authors' calculations from CPS ASEC income CDF and SSA
-     beneficiary data.
- [6] Eisinger, Ernsthausen & Kiel (2021). "The Secret IRS Files."
-     ProPublica.
- [7] Forbes (2024). "The Forbes 400."
- [8] Institute for Policy Studies (2025). "Billionaire Bonanza: The
-     Centi-Billionaire Report."
- [9] Authors' model. FICA reform revenue = cap removal ($~300B) +
-     investment income extension ($~400B) + base growth adjustment.
-[10] Dybvig, P.H. (1995). "Duesenberry's Ratcheting of Consumption."
-     Review of Economic Studies, 62(2): 287-313.
-[11] Moffitt, R.A. (2002). "The Temporary Assistance for Needy
-     Families Program." In Means-Tested Transfer Programs (UChicago).
-[12] Wyden, R. (2021). "Billionaires Income Tax." Senate Finance.
-     JCT score: $557B/10yr.
-[13] Moore v. United States, 602 U.S. ___ (2024).
-[14] Brulhart, M., J. Gruber, M. Krapf, K. Schmidheiny (2022).
-     "Behavioral Responses to Wealth Taxes." AEJ: Econ Policy,
-     14(4): 111-150.
-[15] Scheuer, F. and J. Slemrod (2021). "Taxing Our Wealth."
-     J. Economic Perspectives, 35(1): 207-230.
-[16] Norges Bank Investment Management (2024). "GPFG Annual Report."
-[17] Alaska Permanent Fund Corporation (2024). Annual Report.
-[18] Gini estimation: Lerman-Yitzhaki (1985) decomposition for
-     universal transfers; adjusted for means-tested targeting with
-     concentration bonus of 0.40.
-[19] Lerman, R.I. and S. Yitzhaki (1985). "Income Inequality Effects
-     by Income Source." REStat, 67(1): 151-156.
-[20] Jappelli, T. and L. Pistaferri (2010). "Consumption Response to
-     Income Changes." Ann Rev Econ, 2: 479-506.
-[21] CBO (2020). "Estimated Macroeconomic Effects of Spending and
-     Revenue Options."
-[22] Marinescu, I. (2018). "No Strings Attached." NBER WP 24337.
-[23] Hamalainen et al. (2020). Finland Basic Income Experiment.
-[24] Ostry, Berg & Tsangarides (2014). "Redistribution, Inequality,
-     and Growth." IMF SDN/14/02.
-[25] Gabaix, X. and R. Koijen (2022). "In Search of the Origins of
-     Financial Fluctuations." NBER WP 28967.
-"""
+import functools
+import importlib.util
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Final
+
+_HERE = Path(__file__).parent
+
+
+def _load_box_drawing() -> ModuleType:
+    # The directory is not a package, so the shared helpers are loaded by path
+    # like the prose files; registering the module lets both documents share
+    # one copy of it and of its interned rules.
+    name = '_medium_format_box_drawing'
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, _HERE / 'box_drawing.py')
+        module = sys.modules[name] = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
+
+
+_box = _load_box_drawing()
+
+# Full-width rules framing the section headings.
+_HR: Final[str] = _box.hline("─", 74)
+_HR_DOUBLE: Final[str] = _box.hline("═", 74)
+
+
+# Footnotes in order; note [n] is NOTES[n - 1]. Wrapped lines are separated
+# by newlines and indented to the note text when rendered.
+NOTES: tuple[str, ...] = (
+    'SSA (2024). "2024 Annual Report of the Board of Trustees of the\n'
+    'OASDI Trust Funds."',
+    'CBO (2024). "CBO\'s Long-Term Projections for Social Security."',
+    'Census Bureau (2023). CPS ASEC. Income distribution data.',
+    'Glasmeier, A.K. (2024). "Living Wage Calculator." MIT.',
+    "Authors' calculations from CPS ASEC income CDF and SSA\n"
+    'beneficiary data.',
+    'Eisinger, Ernsthausen & Kiel (2021). "The Secret IRS Files."\n'
+    'ProPublica.',
+    'Forbes (2024). "The Forbes 400."',
+    'Institute for Policy Studies (2025). "Billionaire Bonanza: The\n'
+    'Centi-Billionaire Report."',
+    "Authors' model. FICA reform revenue = cap removal ($~300B) +\n"
+    'investment income extension ($~400B) + base growth adjustment.',
+    'Dybvig, P.H. (1995). "Duesenberry\'s Ratcheting of Consumption."\n'
+    'Review of Economic Studies, 62(2): 287-313.',
+    'Moffitt, R.A. (2002). "The Temporary Assistance for Needy\n'
+    'Families Program." In Means-Tested Transfer Programs (UChicago).',
+    'Wyden, R. (2021). "Billionaires Income Tax." Senate Finance.\n'
+    'JCT score: $557B/10yr.',
+    'Moore v. United States, 602 U.S. ___ (2024).',
+    'Brulhart, M., J. Gruber, M. Krapf, K. Schmidheiny (2022).\n'
+    '"Behavioral Responses to Wealth Taxes." AEJ: Econ Policy,\n'
+    '14(4): 111-150.',
+    'Scheuer, F. and J. Slemrod (2021). "Taxing Our Wealth."\n'
+    'J. Economic Perspectives, 35(1): 207-230.',
+    'Norges Bank Investment Management (2024). "GPFG Annual Report."',
+    'Alaska Permanent Fund Corporation (2024). Annual Report.',
+    'Gini estimation: Lerman-Yitzhaki (1985) decomposition for\n'
+    'universal transfers; adjusted for means-tested targeting with\n'
+    'concentration bonus of 0.40.',
+    'Lerman, R.I. and S. Yitzhaki (1985). "Income Inequality Effects\n'
+    'by Income Source." REStat, 67(1): 151-156.',
+    'Jappelli, T. and L. Pistaferri (2010). "Consumption Response to\n'
+    'Income Changes." Ann Rev Econ, 2: 479-506.',
+    'CBO (2020). "Estimated Macroeconomic Effects of Spending and\n'
+    'Revenue Options."',
+    'Marinescu, I. (2018). "No Strings Attached." NBER WP 24337.',
+    'Hamalainen et al. (2020). Finland Basic Income Experiment.',
+    'Ostry, Berg & Tsangarides (2014). "Redistribution, Inequality,\n'
+    'and Growth." IMF SDN/14/02.',
+    'Gabaix, X. and R. Koijen (2022). "In Search of the Origins of\n'
+    'Financial Fluctuations." NBER WP 28967.',
+)
+
+
+def render_notes() -> str:
+    """The NOTES block as printed at the end of the brief."""
+    lines = [f"{f'[{i}]':>4} " + note.replace('\n', '\n     ')
+             for i, note in enumerate(NOTES, 1)]
+    return "\n".join(lines) + "\n"
+
+
+# The numeric tables are kept as data and rendered into the brief, so the
+# figures can be used directly without parsing the box drawings.
+
+# (year, Tier 2 $/month, retiree total $/month, cumulative benefit/person $)
+PROJECTED_BENEFITS: tuple[tuple[int, int, int, int], ...] = (
+    (0, 249, 2156, 0),
+    (5, 282, 2388, 15711),
+    (10, 398, 2723, 34906),
+    (20, 762, 3596, 98349),
+    (30, 1731, 5185, 228332),
+)
+
+# (year or None for current, income Gini, nearest OECD comparison)
+GINI_TRAJECTORY: tuple[tuple[int | None, float, str], ...] = (
+    (None, 0.390, '(worst in OECD)'),
+    (5, 0.378, 'Still worse than UK (0.35)'),
+    (10, 0.373, 'Approaching UK level'),
+    (30, 0.321, 'Near Canada (0.30)'),
+)
+
+# (risk, bound, probability %, probability qualifier, mitigation)
+RISKS: tuple[tuple[str, str, int, str, str], ...] = (
+    ('M2M tax unconstitutional', '~', 30, '', 'Alternative structures'),
+    ('Avoidance exceeds estimate', '~', 25, '', 'Revenue-constrained'),
+    ('Market crash (>40%)', '~', 15, '/30yr', 'Reserve fund, ratchet'),
+    ('Political reversal', '~', 20, '', 'Universality = 3rd rail'),
+    ('Labor supply shock', '~', 5, '', 'Benefits are moderate'),
+    ('Emigration wave', '<', 5, '', 'Exit tax = 23.8%'),
+)
+
+
+def _format_benefits() -> str:
+    dollars = _box.dollars
+    return _box.box_table(
+        [(' Year', ' Tier 2 ($/mo)', ' Retiree Total', ' Cum. Benefit/Person')],
+        [(f"{year:>4}", f"{dollars(tier2):>8}", f"  {dollars(total)}", f"{dollars(cum):>10}")
+         for year, tier2, total, cum in PROJECTED_BENEFITS],
+        (6, 14, 18, 22),
+    )
+
+
+def _format_gini() -> str:
+    return _box.box_table(
+        [(' Year', ' Income Gini', ' Nearest OECD Country')],
+        [(" Current" if year is None else f" {year:>2}", f"   {gini:.3f}", f" {country}")
+         for year, gini, country in GINI_TRAJECTORY],
+        (10, 12, 38),
+    )
+
+
+def _format_risks() -> str:
+    return _box.box_table(
+        [(' Risk', ' Probability', ' Mitigation')],
+        [(f" {risk}", f"{f'{bound}{pct}%':>8}{qual}", f" {mitigation}")
+         for risk, bound, pct, qual, mitigation in RISKS],
+        (28, 14, 25),
+    )
+
+
+# The brief's prose lives in policy_brief_sections/, one file per section, and
+# is read on first use, so importing this module does not decode ~30 KB of
+# text. The files are str.format templates; the {..._table} fields take the
+# rendered tables.
+SECTION_KEYS = (
+    '0_title_abstract', '1_background', '2_proposal', '3_equity_fund',
+    '4_distribution', '5_macroeconomics', '6_risks', '7_implementation',
+    '8_conclusion', '9_notes',
+)
+
+# Section headings, rendered between rules ahead of each section's file. The
+# title block in 0_title_abstract is the brief's masthead and stays in its file.
+SECTION_TITLES: dict[str, tuple[str, str]] = {
+    '1_background': ('1. BACKGROUND AND MOTIVATION', _HR),
+    '2_proposal': ('2. THE PROPOSAL', _HR),
+    '3_equity_fund': ('3. THE AMERICAN EQUITY FUND', _HR),
+    '4_distribution': ('4. DISTRIBUTIONAL IMPACT', _HR),
+    '5_macroeconomics': ('5. MACROECONOMIC EFFECTS', _HR),
+    '6_risks': ('6. RISKS AND LIMITATIONS', _HR),
+    '7_implementation': ('7. IMPLEMENTATION PATHWAY', _HR),
+    '8_conclusion': ('8. CONCLUSION', _HR),
+    '9_notes': ('NOTES', _HR_DOUBLE),
+}
+
+
+@functools.cache
+def _tables() -> dict[str, str]:
+    return {
+        'benefits_table': _format_benefits(),
+        'gini_table': _format_gini(),
+        'risks_table': _format_risks(),
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def get_section(key: str) -> str:
+    """One section of the brief, with its tables rendered."""
+    if key not in SECTION_KEYS:
+        raise KeyError(f"unknown policy brief section {key!r}")
+    text = (_HERE / 'policy_brief_sections' / f'{key}.txt').read_text(encoding='utf-8')
+    text = text.format_map(_tables())
+    if key in SECTION_TITLES:
+        text = _box.heading(*SECTION_TITLES[key]) + text
+    return text
+
+
+# Deployments that only need the brief's body can set SSEXT_INCLUDE_NOTES=0
+# to leave the footnote block out (it is then never rendered).
+_INCLUDE_NOTES = os.environ.get('SSEXT_INCLUDE_NOTES', '1') == '1'
+
+
+def get_policy_brief() -> str:
+    """Full text of the policy brief, notes included unless disabled.
+
+    Not cached: the sections are, and joining them is cheap, so a process
+    that only writes the bytes form never holds a second full str copy.
+    """
+    if not _INCLUDE_NOTES:
+        return "\n".join(map(get_section, SECTION_KEYS[:-1]))
+    return "\n".join(map(get_section, SECTION_KEYS)) + render_notes()
+
+
+@functools.lru_cache(maxsize=1)
+def get_policy_brief_bytes() -> bytes:
+    """The brief as UTF-8 bytes, encoded once per process."""
+    return get_policy_brief().encode('utf-8')
+
+
+@functools.lru_cache(maxsize=1)
+def get_word_count() -> int:
+    # Exact whitespace-token count; the brief is newline-wrapped and its
+    # tables are space-padded, so counting spaces would badly overstate it.
+    # Counted from the cached bytes so no second full str is joined; the
+    # decoded copy is dropped as soon as it has been split.
+    return len(get_policy_brief_bytes().decode('utf-8').split())
+
+
+# The assembled brief and what is derived from it.
+_LAZY = {
+    'POLICY_BRIEF': get_policy_brief,
+    'POLICY_BRIEF_BYTES': get_policy_brief_bytes,
+    '_WORD_COUNT': get_word_count,
+}
+
+
+def __getattr__(name):
+    # PEP 562: each name in _LAZY stays importable as a module constant but is
+    # only built on first access; binding it as an ordinary global means later
+    # lookups never reach this hook. The other proposal modules use the same
+    # shim.
+    try:
+        loader = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = loader()
+    return value
 
 
 if __name__ == '__main__':
-    print(POLICY_BRIEF)
-    words = len(POLICY_BRIEF.split())
-    print(f"\n  Word count: {words}")
+    out = sys.stdout.buffer
+    out.write(get_policy_brief_bytes())
+    out.write(f"\n\n  Word count: {get_word_count()}\n".encode('utf-8'))
@@ -6,719 +6,194 @@ Tone: Technical but accessible, comprehensive
 Citations: 30-50 endnotes
 """
 
-WHITE_PAPER = """
-══════════════════════════════════════════════════════════════════════════════
-  THE SOCIAL SECURITY EXTENSION ACT:
-  Revenue-Constrained Income Security Through FICA Reform,
-  Mark-to-Market Billionaire Taxation, and Sovereign Equity Fund
-
-  White Paper Prepared for the Senate Committee on Finance
-  and the House Committee on Ways and Means
-══════════════════════════════════════════════════════════════════════════════
-
-TABLE OF CONTENTS
-
-  1.  Executive Summary
-  2.  The Twin Crises: Insolvency and Income Inadequacy
-  3.  Legislative Framework: Three Components
-  4.  Revenue Analysis
-  5.  Benefit Structure and Projections
-  6.  The American Equity Fund
-  7.  Distributional Analysis
-  8.  Macroeconomic Impact Assessment
-  9.  Behavioral Response Modeling
-  10. Constitutional Considerations
-  11. International Precedents
-  12. Implementation Timeline
-  13. Risk Assessment and Sensitivity Analysis
-  14. Comparison with Alternative Proposals
-  15. Legislative Language Recommendations
-  16. Appendices
-
-══════════════════════════════════════════════════════════════════════════════
-  1. EXECUTIVE SUMMARY
-══════════════════════════════════════════════════════════════════════════════
-
-The Social Security Extension Act (SSEA) addresses the projected
-insolvency of the OASDI trust fund (2034) while simultaneously
-establishing a funded second tier of Social Security benefits for the
-138 million American adults — 53.4% of the adult population — who earn
-below the MIT Living Wage Calculator's national average of $2,200 per
-month.
-
-The Act has three components:
-
-  I.   FICA Restructuring: Removal of the earnings cap, extension of
-       payroll contributions to investment income, generating $728
-       billion per year in new revenue.
-
-  II.  Tier 2 Benefit: A monthly income supplement for SS beneficiaries
-       and working-age adults below the living wage. Revenue-constrained:
-       benefits equal only what the system collects.
-
-  III. Billionaire Income Tax: A 40% mark-to-market tax on the economic
-       income of individuals with >$1 billion in net worth, generating
-       approximately $210 billion per year (Year 0), allocated to a
-       sovereign equity fund and direct benefits.
-
-KEY PROJECTIONS (Moderate Scenario, 40-Year Horizon):
-
-  Total 30-year revenue:        $72.0 trillion
-  SS deficit covered:           $11.6 trillion (system solvent throughout)
-  Total benefits distributed:   $30.6 trillion
-  Equity fund balance (Y30):    $7.8 trillion
-  Monthly benefit at Y30:       $1,731 per eligible adult
-  Retiree total at Y30:         $5,185/month (SS + Tier 2 + Tier 3)
-  Income Gini:                  0.39 to 0.32 (18% reduction)
-  GDP effect at Y30:            +5.3% (net positive)
-  Deficit spending required:    $0 (fully self-funded)
-
-══════════════════════════════════════════════════════════════════════════════
-  2. THE TWIN CRISES: INSOLVENCY AND INCOME INADEQUACY
-══════════════════════════════════════════════════════════════════════════════
-
-2.1 OASDI Trust Fund Insolvency
-
-The 2024 Trustees Report projects combined OASI and DI trust fund
-reserve depletion in calendar year 2034.[1] At that point, continuing
-income would be sufficient to pay approximately 77% of scheduled
-benefits. For the average retired worker receiving $1,907 per month,
-this represents a reduction of approximately $439 per month —
-annualized to $5,268 per beneficiary.
-
-The fundamental driver is demographic: the worker-to-beneficiary ratio
-has declined from 5.1:1 in 1960 to 2.7:1 today (2024), and is projected
-to fall to 2.1:1 by 2040.[2] Combined with rising healthcare costs and
-longer lifespans, the current FICA structure — capped at $168,600 in
-earned income, with no application to capital income — cannot sustain
-the system.
-
-The current annual OASDI deficit is approximately $200 billion and
-growing at 3-3.5% per year in real terms.
-
-2.2 Income Inadequacy Among Working Adults
-
-The MIT Living Wage Calculator estimates that a single adult in the
-United States requires approximately $2,200 per month ($26,400 per
-year) to meet basic living expenses — housing, food, transportation,
-healthcare, and other necessities — without government assistance.[3]
-
-Analysis of Census Bureau CPS ASEC (2023) data reveals that
-approximately 37% of working-age adults (ages 18-66) earn below this
-threshold.[4] This represents approximately 71 million individuals who
-participate in the labor force (or seek to) but whose market income is
-insufficient for basic self-sufficiency.
-
-The distribution within this below-living-wage population is:
-  ~30% earn $0-500/month   (zero income, students, caregivers)
-  ~25% earn $500-1,250/month (part-time, gig work)
-  ~25% earn $1,250-1,750/month (full-time minimum/low wage)
-  ~20% earn $1,750-2,200/month (near the threshold)
-
-2.3 The Untaxed Wealth Accumulation Channel
-
-ProPublica's 2021 analysis of confidential IRS records documented that
-the 25 wealthiest Americans paid a "true tax rate" of approximately
-3.4% on their wealth growth from 2014 to 2018.[5] The mechanism —
-collateralized borrowing against unrealized appreciation, followed by
-stepped-up basis at death (IRC Section 1014) — represents a structural
-failure of the income tax to capture the dominant form of economic
-income for the ultra-wealthy.
-
-As of 2025:
-  - 935 U.S. billionaires hold approximately $8.2 trillion[6]
-  - Top 15 centi-billionaires: $3.2 trillion (39% of total)[7]
-  - Unrealized gains: approximately 56% of billionaire wealth (~$4.6T)
-  - Annual wealth growth (long-run CAGR): ~7.5%
-
-This represents a tax base of approximately $615 billion per year in
-economic income (wealth × growth rate) that is largely untaxed under
-current law.
-
-══════════════════════════════════════════════════════════════════════════════
-  3. LEGISLATIVE FRAMEWORK: THREE COMPONENTS
-══════════════════════════════════════════════════════════════════════════════
-
-3.1 Component I: FICA Restructuring
-
-PROVISION 1(a): Earnings Cap Removal
-
-Amend IRC Section 3121(a) to eliminate the contribution and benefit
-base. All wages as defined under Section 3121(a) would be subject to
-OASDI taxation at the current combined employee-employer rate of 12.4%.
-
-Estimated revenue impact: ~$300 billion/year (JCT-scorable; consistent
-with CBO estimates for similar proposals).[8]
-
-Benefits accrual: The proposal includes two options:
-  Option A: Benefits accrue proportionally (higher contributions =
-            higher future benefits, maintaining the contributory
-            principle)
-  Option B: Contributions above the current cap do not generate
-            additional benefit accrual (pure revenue provision)
-
-PROVISION 1(b): Investment Income Extension
-
-Amend IRC to create a new Social Security Investment Income
-Contribution (SSIIC), applied at 50% of the standard employee OASDI
-rate (currently 3.1%) to:
-  - Net capital gains (realized) per IRC Section 1222
-  - Qualified dividends per IRC Section 1(h)(11)
-  - Net income from carried interest
-  - Other investment income as defined under Section 1411 (NIIT base)
-
-The SSIIC mirrors the existing Net Investment Income Tax (3.8%)
-structure but is earmarked for the OASDI trust fund.
-
-Estimated revenue impact: ~$400 billion/year.[9]
-
-PROVISION 1(c): Employer-Side Phase-In
-
-The employer share of FICA on income above the current cap phases in
-over 5 fiscal years:
-  Year 1: 20% of full employer share
-  Year 2: 40%
-  Year 3: 60%
-  Year 4: 80%
-  Year 5: 100%
-
-This prevents a competitiveness shock to labor-intensive industries.
-
-TOTAL COMPONENT I REVENUE: ~$728 billion/year (Year 0)
-
-3.2 Component II: Tier 2 Benefit
-
-[See Section 5 for detailed benefit projections]
-
-The Tier 2 benefit is a monthly payment to eligible adults, funded
-entirely from Component I revenue after covering the existing OASDI
-deficit and equity fund contributions.
-
-Eligibility:
-  (a) All OASDI beneficiaries (Title II recipients)
-  (b) Adults aged 18-66 with market income below the national
-      living wage standard ($2,200/month, indexed to CPI)
-
-The benefit is revenue-constrained:
-  Tier 2 monthly = max(0, (Revenue - Deficit - Fund Contribution)) /
-                   (Eligible Population × 12)
-
-This formula guarantees solvency by construction. There is no
-unfunded liability.
-
-3.3 Component III: Billionaire Income Tax
-
-[See Sections 9-10 for behavioral response and constitutional analysis]
-
-Amend the Internal Revenue Code to create a new tax on the economic
-income of individuals with net worth exceeding $1 billion, assessed
-annually on a mark-to-market basis.
-
-Rate structure:
-  - 20% on economic income up to $1 billion per year per individual
-  - 40% on economic income exceeding $1 billion per year per individual
-
-"Economic income" is defined as the change in net worth plus
-consumption minus gifts received, consistent with the Haig-Simons
-comprehensive income definition and the Wyden Billionaires Income
-Tax framework.[10]
-
-Liquidity provisions: Taxpayers may elect to defer payment on illiquid
-assets (private companies, real estate) with interest accruing at the
-applicable federal rate plus 1%, secured by the assets in question.
-
-══════════════════════════════════════════════════════════════════════════════
-  4. REVENUE ANALYSIS
-══════════════════════════════════════════════════════════════════════════════
-
-4.1 Revenue Sources and Growth
-
-  ┌────────────────────────┬────────┬────────┬─────────┬──────────────────┐
-  │ Source                 │ Year 0 │ Year 10│ Year 30 │ 30-Year Cum.     │
-  ├────────────────────────┼────────┼────────┼─────────┼──────────────────┤
-  │ FICA cap removal       │ $300B  │  $371B │   $547B │      $12.1T      │
-  │ Investment FICA        │ $400B  │  $475B │   $635B │      $14.8T      │
-  │ Billionaire M2M tax    │ $210B  │  $578B │ $3,943B │      $38.9T      │
-  │ (sub) FICA total       │ $728B  │  $871B │ $1,233B │      $33.1T      │
-  │ TOTAL                  │ $938B  │$1,449B │ $5,176B │      $72.0T      │
-  └────────────────────────┴────────┴────────┴─────────┴──────────────────┘
-
-  Note: FICA revenue grows with GDP and wage growth. Billionaire tax
-  revenue grows with billionaire wealth growth (7.5% CAGR), creating
-  a compounding revenue base.
-
-4.2 Revenue Allocation
-
-  Priority waterfall:
-    1. OASDI deficit coverage (first claim on new revenue)
-    2. American Equity Fund contribution (40% of remainder, first 20 yrs)
-    3. Reserve building (10% of Tier 2 outlays, first 10 years)
-    4. Tier 2 benefit disbursement (all remaining revenue)
-
-══════════════════════════════════════════════════════════════════════════════
-  5. BENEFIT STRUCTURE AND PROJECTIONS
-══════════════════════════════════════════════════════════════════════════════
-
-5.1 Three-Tier Benefit Architecture
-
-  Tier 1: Existing Social Security (unchanged)
-    - Standard OASDI benefits as currently calculated
-    - Average retired worker: $1,907/month (2024)
-    - Grows with COLA (typically 2-3%/year)
-    - PROTECTED: This proposal ensures Tier 1 solvency first
-
-  Tier 2: Revenue-Constrained Income Supplement (NEW)
-    - Funded from FICA reform revenue + 40% of billionaire tax
-    - Paid to eligible adults (SS beneficiaries + below-living-wage)
-    - Revenue-constrained: cannot exceed available funding
-    - Subject to benefit ratchet (no nominal decreases)
-
-  Tier 3: Equity Fund Dividend (NEW)
-    - 3.5% withdrawal from American Equity Fund trailing average
-    - Begins Year 5 (after initial accumulation period)
-    - Paid to same eligible population as Tier 2
-    - Smoothed over 3-year trailing average to reduce volatility
-
-5.2 Detailed Projections (Moderate Scenario)
-
-  ┌──────┬────────┬────────┬─────────┬──────────────┬──────────┬────────┐
-  │ Year │ Tier 2 │ Tier 3 │ Total   │ Retiree Tot. │ Elig.(M) │  Fund  │
-  │      │ ($/mo) │ ($/mo) │ ($/mo)  │ (SS+T2+T3)   │          │  ($T)  │
-  ├──────┼────────┼────────┼─────────┼──────────────┼──────────┼────────┤
-  │   0  │  $249  │   $0   │   $249  │    $2,156    │  137.7   │  $0.5  │
-  │   1  │  $250  │   $0   │   $250  │    $2,196    │  138.2   │  $0.8  │
-  │   2  │  $252  │   $0   │   $252  │    $2,237    │  138.6   │  $1.1  │
-  │   5  │  $262  │  $20   │   $282  │    $2,388    │  140.3   │  $2.4  │
-  │  10  │  $365  │  $33   │   $398  │    $2,723    │  143.9   │  $3.8  │
-  │  15  │  $486  │  $35   │   $521  │    $3,088    │  147.4   │  $4.8  │
-  │  20  │  $710  │  $52   │   $762  │    $3,596    │  150.7   │  $5.9  │
-  │  25  │$1,010  │  $77   │ $1,087  │    $4,216    │  153.4   │  $6.8  │
-  │  30  │$1,630  │ $101   │ $1,731  │    $5,185    │  156.0   │  $7.8  │
-  │  35  │$2,507  │ $132   │ $2,639  │    $6,445    │  158.1   │  $9.1  │
-  │  39  │$3,622  │ $165   │ $3,787  │    $8,126    │  159.4   │ $10.3  │
-  └──────┴────────┴────────┴─────────┴──────────────┴──────────┴────────┘
-
-5.3 Living Wage Milestone Analysis
-
-  When does the Tier 2 benefit, combined with existing income, bring
-  eligible adults above the living wage threshold?
-
-  FOR RETIREES (SS + Tier 2 + Tier 3):
-    Without wealth tax: Living wage reached at Year 22
-    With 40% wealth tax: Living wage reached at Year 8
-
-  FOR WORKING-AGE ADULTS (Market Income + Tier 2 + Tier 3):
-    Earning $1,500/month: Living wage reached at Year 15-25
-    Earning $1,000/month: Living wage reached at Year 25-35
-    Earning $0/month:     NOT reached within 40 years
-                          (requires ~$2,200/mo from Tier 2 alone)
-
-══════════════════════════════════════════════════════════════════════════════
-  6. THE AMERICAN EQUITY FUND
-══════════════════════════════════════════════════════════════════════════════
-
-6.1 Investment Policy
-
-  Asset allocation:
-    - 60-70% global equities (cap-weighted, diversified)
-    - 20-30% fixed income (sovereign bonds, inflation-protected)
-    - 5-10% alternatives (infrastructure, real assets)
-    - 0% single-company positions exceeding 3% of company market cap
-
-  Rebalancing: Quarterly, tolerance bands of +/-5% per asset class
-
-  Projected real return: 5.0-6.5% per year (historical global equity
-  real return: 5.2% over 120+ years per Dimson, Marsh & Staunton)
-
-6.2 Governance Structure
-
-  Modeled on Norway's Government Pension Fund Global (the "Norges Bank"
-  model):
-
-  - Independent Board of Governors (7 members, staggered 7-year terms)
-  - Nominated by President, confirmed by Senate
-  - Removal only for cause
-  - Investment policy set by statute (not by Board)
-  - Prohibited from activist ownership or corporate governance pressure
-  - Annual reporting to Congress
-  - GAO audit authority
-  - No Congressional draw rights (benefits calculated algorithmically)
-
-6.3 Size Trajectory
-
-  ┌──────┬────────────┬─────────────────────────────────────────────┐
-  │ Year │ AEF Balance│ Context                                     │
-  ├──────┼────────────┼─────────────────────────────────────────────┤
-  │   0  │    $0.5T   │ Seed from initial FICA reform surplus       │
-  │   5  │    $2.4T   │ Larger than Alaska PFD + state SWFs combined│
-  │  10  │    $3.8T   │ 2x Norway GPFG                              │
-  │  20  │    $5.9T   │ ~10% of projected US equity market cap      │
-  │  30  │    $7.8T   │ Tier 3 dividends at $101/mo/person          │
-  │  40  │   $10.3T   │ Permanent wealth-generating asset           │
-  └──────┴────────────┴─────────────────────────────────────────────┘
-
-══════════════════════════════════════════════════════════════════════════════
-  7. DISTRIBUTIONAL ANALYSIS
-══════════════════════════════════════════════════════════════════════════════
-
-7.1 Gini Coefficient Impact
-
-  INCOME GINI (post-tax, post-transfer):
-    Current (2023):        0.390 (highest in OECD)
-    Year 5 (with SSEA):    0.378
-    Year 10:                0.373
-    Year 30:                0.321 (comparable to Canada at 0.30)
-
-  WEALTH GINI:
-    Current:               0.860
-    Year 30:               ~0.843
-
-  The income Gini improvement is substantial (18% reduction) because
-  the transfer is large relative to recipient incomes. The wealth Gini
-  improvement is modest because transfers are primarily consumed (MPC
-  ~0.90) rather than saved.[11]
-
-7.2 Who Pays, Who Receives
-
-  PAYERS:
-    - All earners above current FICA cap ($168,600+): higher payroll tax
-    - All investment income recipients: new 3.1% SSIIC
-    - 935 billionaires: 40% M2M income tax
-
-  RECIPIENTS:
-    - 67 million SS beneficiaries: SS solvency + Tier 2 + Tier 3
-    - 71 million working-age adults below $2,200/month: Tier 2 + Tier 3
-    - 120 million excluded adults: SS solvency + indirect GDP benefits
-
-7.3 Illustrative Individual Impacts
-
-  BILLIONAIRE (average):
-    Before SSEA: $8.8B → $157B over 30 years (17.8x growth, 10% CAGR)
-    After SSEA:  $8.8B → $110B over 30 years (12.5x growth, 8.8% CAGR)
-    Cumulative tax paid: ~$42M per year initially, growing to ~$4.2B/yr
-    Still a multi-billionaire. Still in the Forbes 400.
-
-  RETIRED WORKER (average SS recipient):
-    Current SS only: $1,907/month (2024), growing with COLA
-    With SSEA (Year 10): $1,907 × 1.02^10 + $398 = $2,723/month
-    With SSEA (Year 30): $1,907 × 1.02^30 + $1,731 = $5,185/month
-    Exceeds living wage by Year 8 (with wealth tax)
-
-  WORKING ADULT earning $1,500/month:
-    Current: $1,500/month (below living wage)
-    With SSEA (Year 10): $1,500 × 1.02^10 + $398 = $2,227/month
-    With SSEA (Year 30): $1,500 × 1.02^30 + $1,731 = $4,448/month
-    Exceeds living wage by Year 10
-
-  WORKING ADULT earning $0/month (student, caregiver):
-    Current: $0/month
-    With SSEA (Year 10): $398/month (Tier 2 + Tier 3)
-    With SSEA (Year 30): $1,731/month
-    Does NOT reach living wage from Tier 2 alone within 40 years
-
-══════════════════════════════════════════════════════════════════════════════
-  8. MACROECONOMIC IMPACT ASSESSMENT
-══════════════════════════════════════════════════════════════════════════════
-
-8.1 GDP Effects
-
-  Channel 1 — Consumption Multiplier: +3.0% to +8.1% of GDP
-    Low-income transfer recipients have MPC of 0.85-0.95.[12]
-    Fiscal multiplier for transfers: 1.3-1.5 (CBO, 2020).[13]
-    This is the dominant channel.
-
-  Channel 2 — Labor Supply: -1.0% to -3.5% of GDP
-    Employment reduction: 1-4% at projected benefit levels.[14]
-    Partially offset by entrepreneurship boost (+2% of replacement rate)
-    and health productivity gains (+1%).[15]
-
-  Channel 3 — Inequality Reduction: +0.1% to +0.3% of GDP/year
-    IMF (2014): 1 pp Gini reduction → 0.1-0.15% higher growth/5yr.[16]
-    This effect compounds over decades.
-
-  NET EFFECT: +1.5% (Year 5) to +5.3% (Year 30) of GDP
-  Equivalent to $460B to $2,668B in additional annual GDP.
-
-8.2 Inflation Effects
-
-  Transfer-driven demand increase is partially inflationary.
-  However, the revenue-constrained design means transfers are funded
-  from taxation, not money creation. The net fiscal impulse is
-  approximately zero (taxes in = transfers out). Inflationary risk
-  is modest and primarily in housing-constrained local markets.
-
-8.3 Financial Market Effects
-
-  The sovereign fund's equity purchases exert upward pressure on equity
-  prices (Gabaix & Koijen, 2022, inelastic markets multiplier ~5x).[17]
-  However:
-    - Annual fund buying ($200-400B) is modest relative to $55T market
-    - The fund is a PERMANENT holder, providing structural demand
-    - The adaptive multiplier diminishes over time as markets adjust
-    - Compressed equity risk premium: ~0.3-0.5% reduction at scale
-
-══════════════════════════════════════════════════════════════════════════════
-  9. BEHAVIORAL RESPONSE MODELING
-══════════════════════════════════════════════════════════════════════════════
-
-9.1 Five Behavioral Regimes
-
-  The model is stress-tested across five calibrated regimes:
-
-  ┌─────────────────────┬───────┬─────────┬───────┬──────────┬──────────┐
-  │ Regime              │ Avoid │ Ceiling │ Evade │ Collect  │ Rev (Y0) │
-  │                     │ Base  │         │       │ Rate     │ at 40%   │
-  ├─────────────────────┼───────┼─────────┼───────┼──────────┼──────────┤
-  │ Pessimistic         │  15%  │   50%   │   5%  │   55%    │  $142B   │
-  │ Original            │  10%  │   45%   │   3%  │   74%    │  $191B   │
-  │ Realistic Central   │   7%  │   30%   │   2%  │   81%    │  $210B   │
-  │ Severely Reduced    │   5%  │   15%   │   1%  │   90%    │  $233B   │
-  │ Near-Zero           │   3%  │    5%   │ 0.5%  │   95%    │  $246B   │
-  └─────────────────────┴───────┴─────────┴───────┴──────────┴──────────┘
-
-  Recommendation: Use Realistic Central for planning. The revenue range
-  across all regimes ($142B to $246B at 40% rate) is narrow enough that
-  the system remains viable under ALL assumptions.
-
-9.2 Emigration Analysis
-
-  IRC Section 877A imposes an exit tax equal to mark-to-market capital
-  gains tax (currently 23.8%) on ALL unrealized gains at the time of
-  expatriation. Combined with non-financial emigration costs (social
-  networks, business operations, political influence), the effective
-  cost of emigration for a billionaire with 56% unrealized gains
-  is approximately 13.3% of total net worth — paid immediately.
-
-  At these cost levels, emigration elasticity is approximately 0.5-2%
-  per year at a 40% statutory rate — far below the level needed to
-  meaningfully erode the tax base.
-
-══════════════════════════════════════════════════════════════════════════════
-  10. CONSTITUTIONAL CONSIDERATIONS
-══════════════════════════════════════════════════════════════════════════════
-
-10.1 The Mark-to-Market Question
-
-  The Sixteenth Amendment grants Congress the power to levy taxes on
-  "incomes, from whatever source derived, without apportionment."
-  The question is whether unrealized appreciation constitutes "income."
-
-  Moore v. United States (2024) addressed this question narrowly. The
-  Court upheld the Mandatory Repatriation Tax (Tax Cuts and Jobs Act,
-  Section 965) on the undistributed income of foreign corporations,
-  but the majority opinion was deliberately narrow, declining to rule
-  on the broader constitutionality of M2M taxation.[18]
-
-  Constitutional risk assessment:
-    - Probability of M2M tax being challenged: >90%
-    - Probability of being struck down (within 10 years): ~30%
-
-10.2 Alternative Structures (Constitutional Fallbacks)
-
-  If M2M is held unconstitutional:
-
-  Option A: Minimum Tax with Lookback
-    - Tax on realized income, but with a lookback provision that
-      imputes a minimum annual rate of return on wealth
-    - Payable upon realization, with interest
-    - Clearly constitutional under existing precedent
-
-  Option B: Mandatory Realization at Death
-    - Eliminate stepped-up basis (IRC 1014)
-    - Impose capital gains tax at death on all unrealized gains
-    - Combined with annual estimated payments based on wealth
-
-  Option C: Annual Wealth Tax via Apportionment
-    - Direct wealth tax, apportioned among the states by population
-    - Administratively complex but constitutionally unambiguous
-
-  The SSEA should be structured to include fallback provisions
-  activating automatically if the primary M2M structure is struck down.
-
-══════════════════════════════════════════════════════════════════════════════
-  11. INTERNATIONAL PRECEDENTS
-══════════════════════════════════════════════════════════════════════════════
-
-11.1 Sovereign Wealth Funds
-
-  NORWAY GOVERNMENT PENSION FUND GLOBAL (GPFG):
-    - AUM: $1.7 trillion (2024)
-    - Source: Oil revenues
-    - Governance: Independent management (Norges Bank), parliamentary
-      oversight, ethical investment guidelines
-    - Real return: 5.7% annualized since 1998
-    - Withdrawal rule: Maximum 3% per year (structural non-oil deficit)
-    - Lesson: Depoliticized governance is achievable and durable[19]
-
-  ALASKA PERMANENT FUND:
-    - AUM: ~$80 billion (2024)
-    - Source: Oil royalties (originally 25% of mineral lease rentals)
-    - Annual dividend: $1,000-$3,000 per resident (varies by returns)
-    - Duration: 40+ years of continuous operation
-    - Political support: Bipartisan; attempts to reduce PFD have
-      uniformly failed
-    - Lesson: Universal cash dividends create powerful political
-      constituencies[20]
-
-11.2 Wealth Tax Experience
-
-  European wealth taxes were largely repealed (France 2018, Sweden 2007,
-  Netherlands suspended). Key lessons:
-
-    - Failures due to: narrow bases, low rates, weak enforcement,
-      EU freedom of movement (easy emigration)[21]
-    - The US context differs: citizenship-based taxation, IRC 877A
-      exit tax, FATCA information reporting, much higher threshold
-      ($1B vs. ~$1M in European cases)
-    - Switzerland retains cantonal wealth taxes with measured success;
-      Brulhart et al. (2022) find administrable collection with
-      elasticities of 0.1-0.4[22]
-
-══════════════════════════════════════════════════════════════════════════════
-  12. IMPLEMENTATION TIMELINE
-══════════════════════════════════════════════════════════════════════════════
-
-  ┌──────────────────────┬──────────────────────────────────────────────┐
-  │ Phase                │ Actions                                      │
-  ├──────────────────────┼──────────────────────────────────────────────┤
-  │ Phase 0 (Year -1)    │ CBO scoring, committee hearings, JCT review │
-  │                      │ Bipartisan working group on AEF governance   │
-  │                      │ Public comment period                        │
-  ├──────────────────────┼──────────────────────────────────────────────┤
-  │ Phase 1 (Year 0)     │ FICA cap removal (immediate)                │
-  │                      │ Investment income FICA begins                │
-  │                      │ AEF governance board confirmed               │
-  │                      │ AEF begins equity accumulation               │
-  ├──────────────────────┼──────────────────────────────────────────────┤
-  │ Phase 2 (Year 1)     │ Tier 2 benefits begin                       │
-  │                      │ Eligibility determination systems deployed   │
-  │                      │ Reserve fund building (10% of outlays)       │
-  ├──────────────────────┼──────────────────────────────────────────────┤
-  │ Phase 3 (Year 2-3)   │ Billionaire M2M tax implemented             │
-  │                      │ Employer FICA phase-in continues             │
-  │                      │ First annual AEF report to Congress          │
-  ├──────────────────────┼──────────────────────────────────────────────┤
-  │ Phase 4 (Year 5)     │ Tier 3 dividends begin from AEF             │
-  │                      │ Employer FICA phase-in complete              │
-  │                      │ First comprehensive program evaluation       │
-  ├──────────────────────┼──────────────────────────────────────────────┤
-  │ Phase 5 (Year 10+)   │ Full system operational                     │
-  │                      │ AEF fund contributions transition to         │
-  │                      │   self-sustaining returns                    │
-  │                      │ Periodic review and adjustment               │
-  └──────────────────────┴──────────────────────────────────────────────┘
-
-══════════════════════════════════════════════════════════════════════════════
-  13. RISK ASSESSMENT AND SENSITIVITY ANALYSIS
-══════════════════════════════════════════════════════════════════════════════
-
-13.1 Scenario Analysis
-
-  ┌──────────────────────┬────────┬──────────┬──────────┬────────────┐
-  │ Parameter            │  Low   │ Central  │   High   │ Source     │
-  ├──────────────────────┼────────┼──────────┼──────────┼────────────┤
-  │ Equity return (real) │  4.0%  │   5.5%   │   7.0%   │ Historical │
-  │ GDP growth (real)    │  1.5%  │   2.0%   │   2.5%   │ CBO       │
-  │ Avoidance rate       │  30%   │   19%    │    5%    │ Literature │
-  │ Labor supply change  │  -4%   │   -2%    │    0%    │ Experiments│
-  │ Emigration rate      │  2%/yr │  0.5%/yr │  0.1%/yr │ IRC 877A  │
-  │ M2M constitutionality│ Struck │ Upheld   │ Upheld   │ Legal      │
-  └──────────────────────┴────────┴──────────┴──────────┴────────────┘
-
-13.2 Key Finding: System Is Robust to Downside Scenarios
-
-  Even in the most pessimistic scenario (low equity returns, high
-  avoidance, M2M struck down), the FICA reform component alone
-  generates sufficient revenue to:
-    - Cover the existing OASDI deficit (100%)
-    - Fund Tier 2 at approximately $106-198/month (universal/targeted)
-    - Build a modest equity fund (~$3.5T by Year 30)
-
-  The billionaire income tax is an ACCELERANT, not the engine. The
-  system works without it — just slower.
-
-══════════════════════════════════════════════════════════════════════════════
-  14. COMPARISON WITH ALTERNATIVE PROPOSALS
-══════════════════════════════════════════════════════════════════════════════
-
-  ┌────────────────────────┬───────────┬────────────────┬───────────────┐
-  │ Proposal               │ SS Fix?   │ New Benefits?  │ Funded?       │
-  ├────────────────────────┼───────────┼────────────────┼───────────────┤
-  │ Status Quo             │ No (2034) │ No             │ N/A           │
-  │ Raise Retirement Age   │ Partial   │ No (cuts)      │ Yes           │
-  │ Lift FICA Cap Only     │ Yes       │ No             │ Yes           │
-  │ Biden Min. Tax (25%)   │ No        │ No             │ Yes ($503B)   │
-  │ Wyden M2M Tax          │ No        │ No             │ Yes ($557B)   │
-  │ Andrew Yang UBI        │ No        │ Yes ($1K/mo)   │ Partially     │
-  │ THIS PROPOSAL (SSEA)   │ Yes       │ Yes (growing)  │ Yes (100%)    │
-  └────────────────────────┴───────────┴────────────────┴───────────────┘
-
-  The SSEA is the only proposal that simultaneously solves SS insolvency,
-  creates new benefits, and is fully self-funded.
-
-══════════════════════════════════════════════════════════════════════════════
-  15. LEGISLATIVE LANGUAGE RECOMMENDATIONS
-══════════════════════════════════════════════════════════════════════════════
-
-The following provisions would require new legislation:
-
-  1. Amendment to IRC Section 3121(a): FICA cap removal
-  2. New IRC Section 1412: Social Security Investment Income Contribution
-  3. New IRC Subchapter: Mark-to-Market Income Tax on Covered Taxpayers
-     (individuals with net worth >$1B, per Wyden framework)
-  4. New Title: American Equity Fund Act (governance, investment policy,
-     withdrawal rules, reporting requirements)
-  5. Amendment to Title II of the Social Security Act: Tier 2 benefit
-     eligibility, calculation formula, revenue-constraint mechanism
-  6. Amendment to IRC Section 877A: Enhanced exit tax provisions for
-     covered taxpayers (align with M2M tax base)
-
-══════════════════════════════════════════════════════════════════════════════
-  16. APPENDICES
-══════════════════════════════════════════════════════════════════════════════
-
-  Appendix A: Full 40-Year Projection Tables (available upon request)
-  Appendix B: Income Distribution CDF (Census CPS ASEC calibration)
-  Appendix C: Behavioral Response Model Specification
-  Appendix D: Monte Carlo Simulation Results (10,000 runs)
-  Appendix E: General Equilibrium Effects (price impact, labor, GDP)
-  Appendix F: International Sovereign Wealth Fund Comparisons
-
-══════════════════════════════════════════════════════════════════════════════
-  ENDNOTES
-══════════════════════════════════════════════════════════════════════════════
-
- [1] SSA (2024). "2024 Annual Report of the Board of Trustees of the
-     OASDI Trust Funds." Washington, DC.
- [2] Ibid., Table IV.B2.
- [3] Glasmeier, A.K. (2024). "Living Wage Calculator." MIT.
- [4] Census Bureau (2023). CPS ASEC.
- [5] Eisinger, Ernsthausen & Kiel (2021). ProPublica.
- [6] Forbes (2024). "The Forbes 400."
- [7] IPS (2025). "Billionaire Bonanza: The Centi-Billionaire Report."
- [8] CBO (2024). "Options for Reducing the Deficit." Option 8: Remove
-     the FICA earnings cap.
- [9] Authors' estimate. Based on $5.6T capital gains + dividends +
-     carried interest × 3.1% SSIIC × behavioral adjustment.
-[10] Wyden, R. (2021). "Billionaires Income Tax." Senate Finance.
-[11] Jappelli & Pistaferri (2010). Ann Rev Econ, 2: 479-506.
-[12] Ibid.
-[13] CBO (2020). "Estimated Macroeconomic Effects of Spending and
-     Revenue Options."
-[14] Marinescu, I. (2018). NBER WP 24337.
-[15] Cesarini et al. (2017). AER, 107(12): 3917-3946; Finland Basic
-     Income Experiment (2020).
-[16] Ostry, Berg & Tsangarides (2014). IMF SDN/14/02.
-[17] Gabaix & Koijen (2022). NBER WP 28967.
-[18] Moore v. United States, 602 U.S. ___ (2024).
-[19] Norges Bank Investment Management (2024). GPFG Annual Report.
-[20] Alaska Permanent Fund Corporation (2024). Annual Report.
-[21] Scheuer & Slemrod (2021). JEP, 35(1): 207-230.
-[22] Brulhart et al. (2022). AEJ: Econ Policy, 14(4): 111-150.
-"""
+import functools
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Final
+
+_HERE = Path(__file__).parent
+
+
+def _load_box_drawing() -> ModuleType:
+    # Same loader as policy_brief.py; whichever runs first registers it.
+    name = '_medium_format_box_drawing'
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, _HERE / 'box_drawing.py')
+        module = sys.modules[name] = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
+
+
+_box = _load_box_drawing()
+
+# Full-width rule framing the section headings.
+_BANNER: Final[str] = _box.hline("═", 78)
+
+
+# The projection tables are kept as data and rendered into the paper, so a
+# refresh of the figures edits one tuple rather than a box drawing.
+
+# (source, Year 0 $B, Year 10 $B, Year 30 $B, 30-year cumulative $T); the
+# TOTAL row is FICA total + billionaire tax and is derived when rendered.
+REVENUE_SOURCES: tuple[tuple[str, int, int, int, float], ...] = (
+    ('FICA cap removal', 300, 371, 547, 12.1),
+    ('Investment FICA', 400, 475, 635, 14.8),
+    ('Billionaire M2M tax', 210, 578, 3943, 38.9),
+    ('(sub) FICA total', 728, 871, 1233, 33.1),
+)
+
+# (year, Tier 2 $/mo, Tier 3 $/mo, retiree total $/mo, eligible millions,
+# AEF balance $T), moderate scenario; the Tier 2 + Tier 3 total is derived.
+BENEFIT_PROJECTIONS: tuple[tuple[int, int, int, int, float, float], ...] = (
+    (0, 249, 0, 2156, 137.7, 0.5),
+    (1, 250, 0, 2196, 138.2, 0.8),
+    (2, 252, 0, 2237, 138.6, 1.1),
+    (5, 262, 20, 2388, 140.3, 2.4),
+    (10, 365, 33, 2723, 143.9, 3.8),
+    (15, 486, 35, 3088, 147.4, 4.8),
+    (20, 710, 52, 3596, 150.7, 5.9),
+    (25, 1010, 77, 4216, 153.4, 6.8),
+    (30, 1630, 101, 5185, 156.0, 7.8),
+    (35, 2507, 132, 6445, 158.1, 9.1),
+    (39, 3622, 165, 8126, 159.4, 10.3),
+)
+
+# (year, AEF balance $T, context)
+AEF_TRAJECTORY: tuple[tuple[int, float, str], ...] = (
+    (0, 0.5, 'Seed from initial FICA reform surplus'),
+    (5, 2.4, 'Larger than Alaska PFD + state SWFs combined'),
+    (10, 3.8, '2x Norway GPFG'),
+    (20, 5.9, '~10% of projected US equity market cap'),
+    (30, 7.8, 'Tier 3 dividends at $101/mo/person'),
+    (40, 10.3, 'Permanent wealth-generating asset'),
+)
+
+
+def _format_revenue() -> str:
+    m2m, fica = REVENUE_SOURCES[2:]
+    total = ('TOTAL', *(f + m for f, m in zip(fica[1:], m2m[1:])))
+    dollars = _box.dollars
+    return _box.box_table(
+        [(' Source', ' Year 0', ' Year 10', ' Year 30', ' 30-Year Cum.')],
+        [(f" {source}", f" {dollars(y0)}B", f"{dollars(y10) + 'B':>7} ",
+          f"{dollars(y30) + 'B':>8} ", f"${cum:.1f}T".center(18))
+         for source, y0, y10, y30, cum in (*REVENUE_SOURCES, total)],
+        (24, 8, 8, 9, 18),
+    )
+
+
+def _format_projections() -> str:
+    dollars = _box.dollars
+    return _box.box_table(
+        [(' Year', ' Tier 2', ' Tier 3', ' Total', ' Retiree Tot.', ' Elig.(M)', '  Fund'),
+         ('', ' ($/mo)', ' ($/mo)', ' ($/mo)', ' (SS+T2+T3)', '', '  ($T)')],
+        [(f"{year:>4}", f"{dollars(tier2):>6}", f"{dollars(tier3):>5}",
+          f"{dollars(tier2 + tier3):>7}", f"{dollars(retiree):>10}",
+          f"{eligible:>7.1f}", f"{f'${fund:.1f}':>6}")
+         for year, tier2, tier3, retiree, eligible, fund in BENEFIT_PROJECTIONS],
+        (6, 8, 8, 9, 14, 10, 8),
+    )
+
+
+def _format_aef() -> str:
+    return _box.box_table(
+        [(' Year', ' AEF Balance', ' Context')],
+        [(f"{year:>4}", f"{f'${balance:.1f}T':>9}", f" {context}")
+         for year, balance, context in AEF_TRAJECTORY],
+        (6, 12, 45),
+    )
+
+
+# The paper's prose lives in white_paper_sections/, one file per section, and
+# is read on first use. The files are str.format templates; the {..._table}
+# fields take the rendered tables.
+SECTION_KEYS = (
+    '0_title_contents', '1_executive_summary', '2_twin_crises',
+    '3_legislative_framework', '4_revenue', '5_benefits', '6_equity_fund',
+    '7_distribution', '8_macroeconomics', '9_behavioral', '10_constitutional',
+    '11_international', '12_implementation', '13_risks', '14_alternatives',
+    '15_legislative_language', '16_appendices', '17_endnotes',
+)
+
+# Section headings, rendered between banners ahead of each section's file.
+# The masthead in 0_title_contents stays in its file.
+SECTION_TITLES: dict[str, str] = {
+    '1_executive_summary': '1. EXECUTIVE SUMMARY',
+    '2_twin_crises': '2. THE TWIN CRISES: INSOLVENCY AND INCOME INADEQUACY',
+    '3_legislative_framework': '3. LEGISLATIVE FRAMEWORK: THREE COMPONENTS',
+    '4_revenue': '4. REVENUE ANALYSIS',
+    '5_benefits': '5. BENEFIT STRUCTURE AND PROJECTIONS',
+    '6_equity_fund': '6. THE AMERICAN EQUITY FUND',
+    '7_distribution': '7. DISTRIBUTIONAL ANALYSIS',
+    '8_macroeconomics': '8. MACROECONOMIC IMPACT ASSESSMENT',
+    '9_behavioral': '9. BEHAVIORAL RESPONSE MODELING',
+    '10_constitutional': '10. CONSTITUTIONAL CONSIDERATIONS',
+    '11_international': '11. INTERNATIONAL PRECEDENTS',
+    '12_implementation': '12. IMPLEMENTATION TIMELINE',
+    '13_risks': '13. RISK ASSESSMENT AND SENSITIVITY ANALYSIS',
+    '14_alternatives': '14. COMPARISON WITH ALTERNATIVE PROPOSALS',
+    '15_legislative_language': '15. LEGISLATIVE LANGUAGE RECOMMENDATIONS',
+    '16_appendices': '16. APPENDICES',
+    '17_endnotes': 'ENDNOTES',
+}
+
+
+@functools.cache
+def _tables() -> dict[str, str]:
+    return {
+        'revenue_table': _format_revenue(),
+        'projection_table': _format_projections(),
+        'aef_table': _format_aef(),
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def get_section(key: str) -> str:
+    """One section of the paper, with its heading and tables rendered."""
+    if key not in SECTION_KEYS:
+        raise KeyError(f"unknown white paper section {key!r}")
+    text = (_HERE / 'white_paper_sections' / f'{key}.txt').read_text(encoding='utf-8')
+    text = text.format_map(_tables())
+    if key in SECTION_TITLES:
+        text = _box.heading(SECTION_TITLES[key], _BANNER) + text
+    return text
+
+
+@functools.cache
+def get_white_paper() -> str:
+    """Full text of the white paper, assembled from its sections on first use."""
+    return "".join(map(get_section, SECTION_KEYS))
+
+
+# WHITE_PAPER keeps the ~40 KB of text out of the import until first use.
+_LAZY = {
+    'WHITE_PAPER': get_white_paper,
+}
+
+
+def __getattr__(name):
+    # PEP 562 lazy constants, as in policy_brief.py.
+    try:
+        loader = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = loader()
+    return value
+
+
+def release_text():
+    """Drop the cached text; it is re-read from the section files on next use."""
+    get_white_paper.cache_clear()
+    get_section.cache_clear()
+    for name in _LAZY:
+        globals().pop(name, None)
 
 
 if __name__ == '__main__':
+    WHITE_PAPER = get_white_paper()
     print(WHITE_PAPER[:3000])
     print("  [... continued — full document is ~12,000 words ...]")
     words = len(WHITE_PAPER.split())